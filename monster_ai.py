@@ -0,0 +1,185 @@
+"""
+Monster Battle Arena - Enemy AI (Expectimax)
+Musuh memilih normal/special attack dengan expectimax search atas giliran
+berikutnya memakai damage model engine (build_damage_table):
+- node max    : musuh memilih serangan dengan peluang menang terbesar
+- node chance : pemain memakai special dengan peluang player_special_chance
+
+Dengan damage table bawaan engine special attack tidak pernah lebih lemah,
+jadi search selalu berakhir memilih special dan kedalaman tidak membedakan
+tingkat kesulitan. Karena itu setiap tingkat juga punya accuracy: peluang
+musuh memakai hasil search; sisanya musuh memilih secara acak seperti "easy".
+Search baru berperan jika damage table lain (argumen damage_table) membuat
+normal attack lebih baik pada state tertentu.
+
+Hasil search disimpan di transposition table dengan key (HP pemain, HP musuh,
+turn), dikosongkan di awal setiap search, dan kedalaman dinaikkan bertahap (iterative deepening) sampai batas
+waktu per langkah habis, sehingga keputusan selalu selesai dalam beberapa
+milidetik dan tidak menahan event loop Tk.
+
+Pemakaian:
+    game.set_enemy_ai(EnemyAI("hard"))
+"""
+
+import math
+import time
+from collections import namedtuple
+
+from monster_engine import SPECIAL_CHANCE, build_damage_table
+
+
+# max_depth: kedalaman maksimum (jumlah giliran musuh)
+# accuracy: peluang memakai hasil search per giliran (sisanya pilihan acak)
+Difficulty = namedtuple("Difficulty", ["max_depth", "accuracy"])
+
+# None = tanpa search, musuh memakai special dengan peluang SPECIAL_CHANCE
+DIFFICULTIES = {
+    "easy": None,
+    "normal": Difficulty(2, 0.35),
+    "hard": Difficulty(6, 0.6),
+    "expert": Difficulty(64, 1.0),
+}
+
+TIME_BUDGET = 0.003  # Detik per keputusan
+
+
+def enemy_special_chance(difficulty):
+    """
+    Peluang musuh memakai special per giliran pada tingkat difficulty.
+    Dengan damage table bawaan search selalu memilih special, jadi giliran
+    yang memakai search = special dan sisanya acak (SPECIAL_CHANCE).
+    """
+    level = DIFFICULTIES[difficulty]
+    if level is None:
+        return SPECIAL_CHANCE
+    return level.accuracy + (1 - level.accuracy) * SPECIAL_CHANCE
+
+
+class _Timeout(Exception):
+    """Batas waktu search habis di tengah iterasi"""
+
+
+class EnemyAI:
+    """
+    AI musuh untuk BattleGame (lihat BattleGame.set_enemy_ai)
+    choose(game) mengembalikan True untuk special attack, False untuk normal,
+    atau None agar engine memakai pilihan acak biasa.
+    """
+    def __init__(self, difficulty="hard", time_budget=TIME_BUDGET, player_special_chance=SPECIAL_CHANCE,
+                 damage_table=None):
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        self.__difficulty = difficulty
+        level = DIFFICULTIES[difficulty]
+        self.__max_depth = None if level is None else level.max_depth
+        self.__accuracy = 0.0 if level is None else level.accuracy
+        self.__time_budget = time_budget
+        self.__player_special_chance = player_special_chance
+        # {(attacker, defender): (normal damage, special damage)}, default build_damage_table()
+        self.__damage_table = build_damage_table() if damage_table is None else damage_table
+        self.__matchup = None
+        self.__table = {}  # (player_hp, enemy_hp, turn) -> (depth, value, is_special)
+        self.__deadline = 0.0
+        self.__last_depth = 0
+
+    def get_difficulty(self):
+        return self.__difficulty
+
+    def get_last_depth(self):
+        """Kedalaman terakhir yang selesai dicari pada keputusan terakhir"""
+        return self.__last_depth
+
+    def get_table_size(self):
+        return len(self.__table)
+
+    def clear(self):
+        """Mengosongkan transposition table"""
+        self.__table.clear()
+
+    def choose(self, game):
+        """Memilih serangan musuh untuk state game saat ini"""
+        if self.__max_depth is None:
+            return None
+        if self.__accuracy < 1 and game.random() >= self.__accuracy:
+            return None  # Giliran ini musuh "lengah": pilihan acak dari engine
+        self.__matchup = (game.get_player_type(), game.get_enemy_type())
+        player_hp = game.get_player_monster().get_current_hp()
+        enemy_hp = game.get_enemy_monster().get_current_hp()
+        return self.search(player_hp, enemy_hp, game.get_turn())
+
+    def search(self, player_hp, enemy_hp, turn):
+        """
+        Iterative deepening dari state giliran musuh.
+        Mengembalikan pilihan terbaik dari kedalaman terakhir yang selesai.
+        """
+        self.__deadline = time.perf_counter() + self.__time_budget
+        # Table hanya dipakai dalam satu search: nilai dari search lain bisa berasal
+        # dari kedalaman berbeda (heuristik vs exact) dan membuat perbandingan tidak adil
+        self.__table.clear()
+        normal, special = self.__damage_table[self.__matchup[::-1]]
+        best = special >= normal  # Fallback jika kedalaman 1 pun tidak selesai: serangan terkuat
+        self.__last_depth = 0
+        for depth in range(1, self.__max_depth + 1):
+            try:
+                _, best, exact = self.__enemy_node(player_hp, enemy_hp, turn, depth)
+            except _Timeout:
+                break
+            self.__last_depth = depth
+            if exact:
+                break  # Semua cabang sudah sampai akhir battle
+        return best
+
+    def evaluate(self, player_hp, enemy_hp):
+        """Perkiraan peluang menang musuh untuk state yang tidak dicari lebih dalam"""
+        enemy_best = max(self.__damage_table[self.__matchup[::-1]])
+        enemy_turns = math.ceil(player_hp / enemy_best)
+        p = self.__player_special_chance
+        player_normal, player_special = self.__damage_table[self.__matchup]
+        player_turns = math.ceil(enemy_hp / ((1 - p) * player_normal + p * player_special))
+        # Musuh menyerang setelah pemain, jadi butuh giliran lebih sedikit untuk unggul
+        return 1 / (1 + math.exp(enemy_turns - player_turns + 0.5))
+
+    def __enemy_node(self, player_hp, enemy_hp, turn, depth):
+        """Node max: (nilai, pilihan special?, exact?) untuk giliran musuh"""
+        key = (player_hp, enemy_hp, turn)
+        entry = self.__table.get(key)
+        if entry is not None and entry[0] >= depth:
+            return entry[1], entry[2], entry[0] == math.inf
+        if time.perf_counter() > self.__deadline:
+            raise _Timeout
+
+        best_value = -1.0
+        best_special = True
+        exact = True
+        damages = self.__damage_table[self.__matchup[::-1]]
+        # Serangan terkuat dicoba dulu sehingga nilai seri memilih serangan itu
+        for is_special in ((True, False) if damages[1] >= damages[0] else (False, True)):
+            damage = damages[is_special]
+            remaining = player_hp - damage
+            if remaining <= 0:
+                value, branch_exact = 1.0, True
+            else:
+                value, branch_exact = self.__chance_node(remaining, enemy_hp, turn, depth)
+            exact = exact and branch_exact
+            if value > best_value:
+                best_value, best_special = value, is_special
+
+        self.__table[key] = (math.inf if exact else depth, best_value, best_special)
+        return best_value, best_special, exact
+
+    def __chance_node(self, player_hp, enemy_hp, turn, depth):
+        """Node chance: giliran pemain berikutnya, (nilai, exact?)"""
+        if depth <= 1:
+            return self.evaluate(player_hp, enemy_hp), False
+        p = self.__player_special_chance
+        value = 0.0
+        exact = True
+        for probability, is_special in ((1 - p, False), (p, True)):
+            damage = self.__damage_table[self.__matchup][is_special]
+            remaining = enemy_hp - damage
+            if remaining <= 0:
+                continue  # Musuh kalah: nilai 0
+            branch, _, branch_exact = self.__enemy_node(player_hp, remaining, turn + 1, depth - 1)
+            value += probability * branch
+            exact = exact and branch_exact
+        return value, exact
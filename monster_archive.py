@@ -0,0 +1,246 @@
+"""
+Monster Battle Arena - Turn Archive (memory-mapped)
+File append-only berisi satu record berukuran tetap (16 byte) untuk setiap
+serangan dari setiap battle. Writer menambah record secara bulk, reader
+membuka file lewat numpy.memmap sehingga scan ratusan juta record tidak
+perlu menyalin data ke memori Python.
+
+Layout file:
+    header (16 byte): magic "MBTA" | version (H) | record size (H) | reserved (8 byte)
+    record (little endian, RECORD_DTYPE):
+        battle_id (u4) | turn (u2) | actor species (u1) | target species (u1)
+        | kind (u1: 0 normal, 1 special) | side (u1: 0 pemain, 1 musuh)
+        | damage (u2) | player HP (i2) | enemy HP (i2)
+
+Membutuhkan numpy (pip install numpy).
+"""
+
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from monster_engine import MONSTER_TYPE_IDS, SPECIAL_CHANCE, BattleGame, play_battle
+
+
+MAGIC = b"MBTA"
+VERSION = 1
+
+RECORD_DTYPE = np.dtype([
+    ("battle_id", "<u4"),
+    ("turn", "<u2"),
+    ("actor", "u1"),
+    ("target", "u1"),
+    ("kind", "u1"),
+    ("side", "u1"),
+    ("damage", "<u2"),
+    ("player_hp", "<i2"),
+    ("enemy_hp", "<i2"),
+])
+
+_HEADER = struct.Struct("<4sHH8x")
+BUFFER_RECORDS = 65536  # Record yang ditahan writer sebelum ditulis
+SCAN_CHUNK = 1 << 22  # Record per potongan saat query (~64 MB)
+LOG_CAPACITY = 4096  # Kapasitas battle log untuk archive_battles (event per battle)
+
+TurnsToKill = namedtuple("TurnsToKill", ["player", "enemy"])
+
+
+class ArchiveError(Exception):
+    """File archive tidak valid"""
+
+
+def _read_header(file):
+    data = file.read(_HEADER.size)
+    if len(data) != _HEADER.size:
+        raise ArchiveError("Truncated archive header")
+    magic, version, record_size = _HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ArchiveError("Not a turn archive")
+    if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ArchiveError(f"Unsupported archive version {version} (record size {record_size})")
+
+
+# ==================== WRITER ====================
+class TurnArchiveWriter:
+    """
+    Menambah record ke archive (file dibuat jika belum ada)
+    Record ditahan di buffer NumPy dan ditulis bulk setiap BUFFER_RECORDS record.
+    """
+    def __init__(self, path, buffer_records=BUFFER_RECORDS):
+        self.path = path
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as file:
+                file.write(_HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize))
+        else:
+            with open(path, "rb") as file:
+                _read_header(file)
+
+        self.__file = open(path, "ab")
+        self.__buffer = np.zeros(buffer_records, dtype=RECORD_DTYPE)
+        self.__used = 0
+        self.__next_battle_id = self.__last_battle_id() + 1
+
+    def __last_battle_id(self):
+        """battle_id record terakhir di file (-1 jika archive kosong)"""
+        size = os.path.getsize(self.path) - _HEADER.size
+        count = size // RECORD_DTYPE.itemsize
+        if count == 0:
+            return -1
+        last = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r",
+                         offset=_HEADER.size + (count - 1) * RECORD_DTYPE.itemsize, shape=(1,))
+        return int(last["battle_id"][0])
+
+    def get_next_battle_id(self):
+        return self.__next_battle_id
+
+    def append_records(self, records):
+        """Menambah array record (RECORD_DTYPE) secara bulk"""
+        records = np.asarray(records, dtype=RECORD_DTYPE)
+        space = len(self.__buffer) - self.__used
+        if len(records) > space:
+            self.flush()
+            if len(records) >= len(self.__buffer):
+                records.tofile(self.__file)
+                return
+        self.__buffer[self.__used:self.__used + len(records)] = records
+        self.__used += len(records)
+
+    def append_battle(self, game):
+        """
+        Menambah semua event di battle log BattleGame sebagai satu battle, mengembalikan battle_id.
+        ArchiveError jika ring buffer log sudah membuang event awal (battle tidak lengkap);
+        pakai BattleGame(log_capacity=...) yang cukup besar untuk battle panjang.
+        """
+        log = game.get_battle_log()
+        if log.get_first_index() > 0:
+            raise ArchiveError(
+                f"Battle log wrapped: {log.get_first_index()} of {log.get_total()} events were "
+                f"dropped (log capacity {log.get_capacity()})"
+            )
+        battle_id = self.__next_battle_id
+        self.__next_battle_id += 1
+        player_id = MONSTER_TYPE_IDS[game.get_player_type()]
+        enemy_id = MONSTER_TYPE_IDS[game.get_enemy_type()]
+        rows = []
+        for turn, actor, _, is_special, damage, player_hp, enemy_hp in log:
+            if actor == "player":
+                rows.append((battle_id, turn, player_id, enemy_id, is_special, 0, damage, player_hp, enemy_hp))
+            else:
+                rows.append((battle_id, turn, enemy_id, player_id, is_special, 1, damage, player_hp, enemy_hp))
+        self.append_records(np.array(rows, dtype=RECORD_DTYPE))
+        return battle_id
+
+    def flush(self):
+        if self.__used:
+            self.__buffer[:self.__used].tofile(self.__file)
+            self.__used = 0
+        self.__file.flush()
+
+    def close(self):
+        self.flush()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def archive_battles(path, player_type, enemy_type, count, seed=None,
+                    player_special_chance=SPECIAL_CHANCE, log_capacity=LOG_CAPACITY):
+    """Memainkan count battle headless dan menambahkan setiap turn-nya ke archive"""
+    game = BattleGame(seed=seed, log_capacity=log_capacity)
+    with TurnArchiveWriter(path) as writer:
+        for _ in range(count):
+            game.reset_battle()
+            game.set_player_monster(player_type)
+            game.create_enemy_monster(enemy_type)
+            play_battle(game, player_special_chance)
+            writer.append_battle(game)
+
+
+# ==================== READER / QUERY ====================
+class TurnArchive:
+    """
+    Reader archive lewat numpy.memmap (zero-copy, read-only)
+    Query dikerjakan per potongan SCAN_CHUNK record agar memori tetap kecil.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            _read_header(file)
+        count = (os.path.getsize(path) - _HEADER.size) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=_HEADER.size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self):
+        return len(self.records)
+
+    def chunks(self, chunk=SCAN_CHUNK):
+        """Iterasi potongan records (view memmap, bukan salinan)"""
+        for start in range(0, len(self.records), chunk):
+            yield self.records[start:start + chunk]
+
+    def battle_count(self):
+        if not len(self.records):
+            return 0
+        return int(self.records["battle_id"][-1]) - int(self.records["battle_id"][0]) + 1
+
+    @staticmethod
+    def __matchup_mask(rows, player_id, enemy_id):
+        """Record dari battle dengan matchup (pemain, musuh) tertentu"""
+        player_side = rows["side"] == 0
+        return (np.where(player_side, rows["actor"], rows["target"]) == player_id) & \
+               (np.where(player_side, rows["target"], rows["actor"]) == enemy_id)
+
+    def damage_distribution(self, player_type, enemy_type, side=0, kind=None):
+        """
+        Distribusi damage pada matchup (player_type vs enemy_type) untuk serangan
+        pemain (side=0) atau musuh (side=1); kind 0/1 memfilter jenis serangan.
+        Mengembalikan dict {damage: jumlah}.
+        """
+        player_id = MONSTER_TYPE_IDS[player_type]
+        enemy_id = MONSTER_TYPE_IDS[enemy_type]
+        counts = np.zeros(0, dtype=np.int64)
+        for rows in self.chunks():
+            mask = self.__matchup_mask(rows, player_id, enemy_id) & (rows["side"] == side)
+            if kind is not None:
+                mask &= rows["kind"] == kind
+            chunk_counts = np.bincount(rows["damage"][mask])
+            counts = _add_counts(counts, chunk_counts)
+        return {damage: int(n) for damage, n in enumerate(counts) if n}
+
+    def turns_to_kill(self, player_type, enemy_type):
+        """
+        Distribusi turn saat battle berakhir pada matchup (player_type vs enemy_type):
+        TurnsToKill(player={turn: jumlah pemain menang}, enemy={turn: jumlah musuh menang}).
+        """
+        player_id = MONSTER_TYPE_IDS[player_type]
+        enemy_id = MONSTER_TYPE_IDS[enemy_type]
+        player_counts = np.zeros(0, dtype=np.int64)
+        enemy_counts = np.zeros(0, dtype=np.int64)
+        for rows in self.chunks():
+            mask = self.__matchup_mask(rows, player_id, enemy_id)
+            player_kills = mask & (rows["side"] == 0) & (rows["enemy_hp"] <= 0)
+            enemy_kills = mask & (rows["side"] == 1) & (rows["player_hp"] <= 0)
+            player_counts = _add_counts(player_counts, np.bincount(rows["turn"][player_kills]))
+            enemy_counts = _add_counts(enemy_counts, np.bincount(rows["turn"][enemy_kills]))
+        return TurnsToKill(
+            {turn: int(n) for turn, n in enumerate(player_counts) if n},
+            {turn: int(n) for turn, n in enumerate(enemy_counts) if n},
+        )
+
+
+def _add_counts(total, counts):
+    """Menjumlahkan dua hasil bincount yang panjangnya bisa berbeda"""
+    if len(counts) > len(total):
+        total, counts = counts.astype(np.int64), total
+    else:
+        total = total.copy()
+    total[:len(counts)] += counts
+    return total
@@ -12,524 +12,872 @@ FITUR BARU: Visual monster dengan bentuk dan animasi
 
 import tkinter as tk
 from tkinter import messagebox
-import random
+import bisect
+import heapq
+import itertools
 import math
+import queue
+import threading
+import time
+from collections import deque, namedtuple
 
+from monster_ai import DIFFICULTIES, EnemyAI, enemy_special_chance
+from monster_engine import BattleGame, format_event, get_species
+from monster_solver import action_values
+from monster_stats import StatsStore
 
-# ==================== ENCAPSULATION ====================
-class Monster:
+
+# ==================== SHAPE TEMPLATES ====================
+# Satu bagian sprite: jenis item canvas, koordinat relatif terhadap titik pusat
+# monster, opsi style, dan apakah fill memakai warna species (body)
+ShapePart = namedtuple("ShapePart", ["kind", "coords", "options", "body"])
+
+
+def part(kind, *coords, body=False, **options):
+    """Membuat ShapePart dengan koordinat relatif (tuple float)"""
+    return ShapePart(kind, tuple(float(c) for c in coords), options, body)
+
+
+class ShapeTemplate:
     """
-    Base class untuk semua monster
-    Mendemonstrasikan ENCAPSULATION dengan atribut private
+    Template vector deklaratif untuk satu bentuk monster
+    Koordinat dihitung sekali saat load; versi yang di-scale di-cache,
+    sehingga menggambar cukup membuat item lalu menggeser semuanya sekaligus
     """
-    def __init__(self, name, max_hp, attack_power, element, color):
-        self.__name = name  # Private attribute
-        self.__max_hp = max_hp  # Private attribute
-        self.__current_hp = max_hp  # Private attribute
-        self.__attack_power = attack_power  # Private attribute
-        self.__element = element  # Private attribute
-        self.__color = color  # Private attribute untuk warna visual
+    def __init__(self, parts):
+        self.parts = tuple(parts)
+        self.__scaled = {1.0: self.parts}
+        self.__compiled = {}  # scale -> tuple (nama method create_*, coords, options, body)
+        self.__max_points = max(len(p.coords) for p in self.parts) // 2
     
-    # Getter methods (Encapsulation)
-    def get_name(self):
-        return self.__name
+    def scaled(self, scale):
+        """Parts dengan koordinat dan lebar outline dikali scale (di-cache)"""
+        parts = self.__scaled.get(scale)
+        if parts is None:
+            parts = tuple(
+                ShapePart(
+                    p.kind,
+                    tuple(c * scale for c in p.coords),
+                    dict(p.options, width=p.options["width"] * scale) if "width" in p.options else p.options,
+                    p.body,
+                )
+                for p in self.parts
+            )
+            self.__scaled[scale] = parts
+        return parts
     
-    def get_max_hp(self):
-        return self.__max_hp
+    def shapes(self, color, scale=1.0):
+        """List (kind, coords, options) dengan warna body sudah diisi"""
+        return [
+            (p.kind, p.coords, dict(p.options, fill=color) if p.body else p.options)
+            for p in self.scaled(scale)
+        ]
     
-    def get_current_hp(self):
-        return self.__current_hp
+    def draw(self, canvas, x, y, color, scale=1.0, tags=None):
+        """Menggambar template di (x, y), mengembalikan list ID item canvas"""
+        compiled = self.__compiled.get(scale)
+        if compiled is None:
+            compiled = tuple(("create_" + p.kind, p.coords, p.options, p.body) for p in self.scaled(scale))
+            self.__compiled[scale] = compiled
+        
+        items = []
+        if tags is None:
+            offsets = (x, y) * self.__max_points
+        for method, coords, options, body in compiled:
+            if body:
+                options = dict(options, fill=color)
+            if tags is None:
+                coords = [c + o for c, o in zip(coords, offsets)]
+            items.append(getattr(canvas, method)(*coords, tags=tags, **options))
+        if tags is not None:
+            # Digambar di sekitar (0, 0), lalu seluruh sprite digeser sekaligus
+            canvas.move(tags, x, y)
+        return items
+
+
+def _flame_parts():
+    """Lidah api Fire monster: 3 segitiga di sekeliling bagian atas tubuh"""
+    parts = []
+    for i in range(3):
+        angle = (i - 1) * 40
+        flame_x = math.cos(math.radians(270 + angle)) * 30
+        flame_y = math.sin(math.radians(270 + angle)) * 30
+        parts.append(part(
+            "polygon",
+            flame_x, flame_y - 25,
+            flame_x - 10, flame_y,
+            flame_x + 10, flame_y,
+            fill="#FFAA00", outline="#FF4400", width=2,
+        ))
+    return parts
+
+
+def _wave_parts():
+    """Gelombang Water monster: 3 garis bergelombang"""
+    parts = []
+    for i in range(3):
+        wave_y = -10 + (i * 15)
+        parts.append(part(
+            "line",
+            -20, wave_y, -10, wave_y - 5, 0, wave_y, 10, wave_y - 5, 20, wave_y,
+            fill="#6688FF", width=2, smooth=True,
+        ))
+    return parts
+
+
+SHAPE_TEMPLATES = {
+    # Fire Monster - bentuk api
+    "fire": ShapeTemplate([
+        part("oval", -40, -40, 40, 40, body=True, outline="#CC0000", width=3),  # Body
+        part("oval", -25, -25, 25, 25, fill="#FF8844", outline=""),  # Inner glow
+        *_flame_parts(),
+        part("oval", -15, -10, -5, 0, fill="#FFFF00", outline="black"),  # Eyes
+        part("oval", 5, -10, 15, 0, fill="#FFFF00", outline="black"),
+        part("oval", -12, -7, -8, -3, fill="black"),  # Pupils
+        part("oval", 8, -7, 12, -3, fill="black"),
+    ]),
+    # Water Monster - bentuk droplet
+    "water": ShapeTemplate([
+        part("polygon", 0, -50, -35, 0, -30, 20, 0, 35, 30, 20, 35, 0,
+             body=True, outline="#0000CC", width=3, smooth=True),  # Body
+        part("oval", -15, -20, 5, 0, fill="#AACCFF", outline=""),  # Highlight
+        *_wave_parts(),
+        part("oval", -15, 0, -5, 10, fill="white", outline="black"),  # Eyes
+        part("oval", 5, 0, 15, 10, fill="white", outline="black"),
+        part("oval", -12, 3, -8, 7, fill="#000088"),  # Pupils
+        part("oval", 8, 3, 12, 7, fill="#000088"),
+    ]),
+    # Earth Monster - bentuk batu
+    "earth": ShapeTemplate([
+        part("polygon", 0, -45, 40, -20, 35, 30, 0, 40, -35, 30, -40, -20,
+             body=True, outline="#228800", width=3),  # Body
+        part("line", -20, -30, -10, 0, -15, 20, fill="#116600", width=2),  # Cracks
+        part("line", 15, -25, 10, 5, 20, 25, fill="#116600", width=2),
+        part("oval", -25, 15, -10, 25, fill="#338833", outline=""),  # Moss
+        part("oval", 10, -10, 20, 0, fill="#338833", outline=""),
+        part("rectangle", -15, -5, -5, 5, fill="#88FF88", outline="black", width=2),  # Eyes
+        part("rectangle", 5, -5, 15, 5, fill="#88FF88", outline="black", width=2),
+        part("rectangle", -12, -2, -8, 2, fill="#004400"),  # Pupils
+        part("rectangle", 8, -2, 12, 2, fill="#004400"),
+    ]),
+}
+
+
+# ==================== VISUAL MONSTER RENDERER ====================
+class MonsterVisual:
+    """
+    Class untuk merender visual monster di canvas
+    Mendemonstrasikan composition dan encapsulation
+    Semua parts diberi satu tag unik agar bisa digeser/dihapus sekaligus
+    """
+    _tag_counter = itertools.count(1)
     
-    def get_attack_power(self):
-        return self.__attack_power
+    def __init__(self, canvas, x, y, monster, is_player=True, render_mode="vector", scale=1.0,
+                 animator=None):
+        # monster boleh berupa Monster atau Species (cukup get_color/get_visual_shape)
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.monster = monster
+        self.is_player = is_player
+        self.render_mode = render_mode  # "vector" atau "sprite" (PhotoImage dari SPRITE_CACHE)
+        self.scale = scale
+        self.parts = []  # List untuk menyimpan ID objek canvas
+        self.tag = f"monster{next(MonsterVisual._tag_counter)}"  # Tag bersama semua parts
+        self.animation_offset = 0
+        self.animator = animator  # Tanpa Animator (mis. preview menu) tidak ada animasi
+        
+    def draw(self):
+        """Menggambar monster berdasarkan tipenya (dari SHAPE_TEMPLATES)"""
+        if self.render_mode == "sprite":
+            self.draw_sprite()
+            return
+        
+        template = SHAPE_TEMPLATES.get(self.monster.get_visual_shape())
+        if template is not None:
+            self.parts.extend(template.draw(
+                self.canvas, self.x, self.y, self.monster.get_color(), self.scale, self.tag
+            ))
     
-    def get_element(self):
-        return self.__element
+    def draw_sprite(self):
+        """Menggambar monster sebagai satu image item dari sprite cache"""
+        # Tidak di-mirror untuk musuh, sama seperti mode vector
+        image, offset_x, offset_y = SPRITE_CACHE.get(self.monster, self.scale)
+        sprite = self.canvas.create_image(
+            self.x + offset_x, self.y + offset_y,
+            image=image, anchor="nw", tags=self.tag
+        )
+        self.parts.append(sprite)
     
-    def get_color(self):
-        return self.__color
+    def animate_attack(self):
+        """Animasi saat monster menyerang (maju lalu kembali, di-tween oleh Animator)"""
+        if self.animator is not None:
+            direction = 1 if self.is_player else -1
+            self.animator.play(self, [(t, o * direction) for t, o in ATTACK_KEYFRAMES])
     
-    # Setter methods (Encapsulation)
-    def set_current_hp(self, hp):
-        self.__current_hp = max(0, min(hp, self.__max_hp))
+    def shake(self):
+        """Animasi shake saat terkena damage"""
+        if self.animator is not None:
+            self.animator.play(self, SHAKE_KEYFRAMES)
     
-    def take_damage(self, damage):
-        """Mengurangi HP monster"""
-        self.__current_hp = max(0, self.__current_hp - damage)
+    def set_offset(self, offset):
+        """Menggeser seluruh sprite ke offset horizontal dari posisi awal"""
+        offset = round(offset)
+        if self.parts and offset != self.animation_offset:
+            self.canvas.move(self.tag, offset - self.animation_offset, 0)
+            self.animation_offset = offset
     
-    def is_alive(self):
-        """Mengecek apakah monster masih hidup"""
-        return self.__current_hp > 0
+    def hide(self):
+        """Menyembunyikan seluruh sprite"""
+        self.canvas.itemconfig(self.tag, state="hidden")
     
-    def get_hp_percentage(self):
-        """Menghitung persentase HP untuk health bar"""
-        return (self.__current_hp / self.__max_hp) * 100
+    def show(self):
+        """Menampilkan kembali sprite yang disembunyikan"""
+        self.canvas.itemconfig(self.tag, state="normal")
     
-    # Method yang akan di-override (Polymorphism)
-    def attack(self, target):
-        """
-        Method dasar untuk menyerang
-        Akan di-override oleh subclass (Polymorphism)
-        """
-        damage = self.__attack_power
-        target.take_damage(damage)
-        return damage
+    def clear(self):
+        """Hapus semua parts dari canvas"""
+        self.canvas.delete(self.tag)
+        self.parts = []
+
+
+# ==================== HEALTH BAR ====================
+HP_DRAIN_MS = 300  # Lama animasi drain HP bar
+
+
+def hp_color(percentage):
+    """Warna health bar berdasarkan persentase HP"""
+    return "#00ff00" if percentage > 50 else "#ffaa00" if percentage > 25 else "#ff0000"
+
+
+class HealthBar:
+    """
+    Health bar dengan satu rectangle permanen dan label HP
+    Canvas/label hanya di-update (coords/itemconfig/config) jika nilainya berubah
+    """
+    def __init__(self, canvas, label, width=200, height=20, animator=None):
+        self.canvas = canvas
+        self.label = label
+        self.width = width
+        self.height = height
+        self.animator = animator  # Jika ada, perubahan HP bisa di-drain perlahan
+        self.__bar = canvas.create_rectangle(0, 0, 0, height, fill=hp_color(100))
+        self.__hp = None  # (current, max) terakhir yang ditampilkan
+        self.__fill_width = 0
+        self.__color = hp_color(100)
     
-    def special_attack(self, target):
-        """Special attack dengan damage lebih besar"""
-        damage = int(self.__attack_power * 1.5)
-        target.take_damage(damage)
-        return damage
+    def set_hp(self, current, maximum, animate=False):
+        """Menampilkan HP baru; animate=True men-drain bar lewat Animator"""
+        if (current, maximum) == self.__hp:
+            return
+        self.__hp = (current, maximum)
+        self.label.config(text=f"HP: {current}/{maximum}")
+        
+        percentage = current / maximum * 100
+        color = hp_color(percentage)
+        if color != self.__color:
+            self.canvas.itemconfig(self.__bar, fill=color)
+            self.__color = color
+        
+        width = int(percentage / 100 * self.width)
+        if self.animator is None:
+            self.set_offset(width)
+            return
+        self.animator.stop(self)
+        if animate and width != self.__fill_width:
+            self.animator.play(self, ((0, self.__fill_width), (HP_DRAIN_MS, width)))
+        else:
+            self.set_offset(width)
     
-    # Method untuk mendapatkan bentuk visual monster
-    def get_visual_shape(self):
-        """Method yang akan di-override untuk bentuk visual berbeda"""
-        return "circle"
+    def set_offset(self, width):
+        """Lebar isi bar dalam pixel (dipanggil langsung atau oleh Animator)"""
+        width = int(width)
+        if width != self.__fill_width:
+            self.canvas.coords(self.__bar, 0, 0, width, self.height)
+            self.__fill_width = width
+
 
+# ==================== SPRITE CACHE ====================
+# Warna bernama yang dipakai di SHAPE_TEMPLATES (selain format #RRGGBB)
+NAMED_COLORS = {
+    "black": "#000000",
+    "white": "#ffffff",
+}
 
-# ==================== INHERITANCE & POLYMORPHISM ====================
-class FireMonster(Monster):
+
+def _parse_color(color):
+    """Mengubah warna Tk menjadi string #rrggbb, None untuk transparan"""
+    if not color:
+        return None
+    color = NAMED_COLORS.get(color.lower(), color)
+    if color.startswith("#") and len(color) == 7:
+        return color.lower()
+    raise ValueError(f"Unsupported color for sprite cache: {color}")
+
+
+def _smooth_points(points, closed, steps=6):
+    """
+    Mendekati smoothing Tk (spline kuadratik lewat titik tengah setiap sisi)
+    sehingga polygon/line dengan smooth=True terlihat sama seperti versi vector.
+    """
+    count = len(points)
+    if count < 3:
+        return list(points)
+    result = []
+    indices = range(count) if closed else range(1, count - 1)
+    for i in indices:
+        prev_point = points[i - 1]
+        point = points[i]
+        next_point = points[(i + 1) % count]
+        start = ((prev_point[0] + point[0]) / 2, (prev_point[1] + point[1]) / 2)
+        end = ((point[0] + next_point[0]) / 2, (point[1] + next_point[1]) / 2)
+        if not closed and i == 1:
+            start = prev_point
+        if not closed and i == count - 2:
+            end = next_point
+        for step in range(steps + 1):
+            t = step / steps
+            a, b, c = (1 - t) ** 2, 2 * (1 - t) * t, t ** 2
+            result.append((a * start[0] + b * point[0] + c * end[0],
+                           a * start[1] + b * point[1] + c * end[1]))
+    return result
+
+
+def _segment_distance(px, py, x0, y0, x1, y1):
+    dx, dy = x1 - x0, y1 - y0
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else max(0.0, min(1.0, ((px - x0) * dx + (py - y0) * dy) / length))
+    cx, cy = x0 + t * dx, y0 + t * dy
+    return math.hypot(px - cx, py - cy)
+
+
+def _scanline_crossings(py, points):
+    """
+    Titik potong sisi polygon dengan garis y = py, terurut.
+    Pixel (px, py) ada di dalam polygon jika jumlah titik potong di kanan px ganjil
+    (aturan even-odd yang sama dengan ray casting per pixel).
+    """
+    crossings = []
+    j = len(points) - 1
+    for i in range(len(points)):
+        xi, yi = points[i]
+        xj, yj = points[j]
+        if (yi > py) != (yj > py):
+            crossings.append((xj - xi) * (py - yi) / (yj - yi) + xi)
+        j = i
+    crossings.sort()
+    return crossings
+
+
+def rasterize_steps(shapes, scale=1.0):
     """
-    Monster tipe Fire - INHERITANCE dari Monster
-    Mendemonstrasikan POLYMORPHISM dengan override method attack()
-    Visual: Bentuk seperti bola api dengan lidah api
+    Merasterisasi primitive canvas (kind, coords, options) menjadi grid warna,
+    satu baris pixel per langkah (generator, yield index baris) agar bisa dicicil.
+    Nilai return generator: tuple (rows, offset_x, offset_y) dengan offset relatif
+    terhadap titik pusat monster.
     """
-    def __init__(self, name="Flameo"):
-        super().__init__(name, max_hp=100, attack_power=25, element="Fire", color="#FF4444")
-    
-    def attack(self, target):
-        """Override: Serangan api dengan bonus damage ke Earth"""
-        base_damage = self.get_attack_power()
-        
-        # Polymorphism: Perilaku berbeda berdasarkan elemen target
-        if target.get_element() == "Earth":
-            damage = int(base_damage * 1.5)  # Super effective!
-        elif target.get_element() == "Water":
-            damage = int(base_damage * 0.7)  # Not effective
+    prepared = []
+    for kind, coords, options in shapes:
+        points = [(x * scale, y * scale) for x, y in zip(coords[::2], coords[1::2])]
+        width = options.get("width", 1) * scale
+        if kind == "line":
+            fill, outline = None, _parse_color(options.get("fill", "black"))
+        elif kind == "polygon":
+            fill, outline = _parse_color(options.get("fill", "black")), _parse_color(options.get("outline", ""))
         else:
-            damage = base_damage
-        
-        target.take_damage(damage)
-        return damage
+            fill, outline = _parse_color(options.get("fill", "")), _parse_color(options.get("outline", "black"))
+        if options.get("smooth") and kind in ("polygon", "line"):
+            points = _smooth_points(points, closed=(kind == "polygon"))
+        prepared.append((kind, points, fill, outline, width))
+    
+    # Bounding box semua shape (+ setengah lebar outline)
+    margin = max(p[4] for p in prepared) / 2 + 1
+    min_x = math.floor(min(x for p in prepared for x, _ in p[1]) - margin)
+    min_y = math.floor(min(y for p in prepared for _, y in p[1]) - margin)
+    max_x = math.ceil(max(x for p in prepared for x, _ in p[1]) + margin)
+    max_y = math.ceil(max(y for p in prepared for _, y in p[1]) + margin)
+    rows = [[None] * (max_x - min_x) for _ in range(max_y - min_y)]
     
-    def special_attack(self, target):
-        """Special: Fireball dengan area damage"""
-        damage = int(self.get_attack_power() * 2)
-        target.take_damage(damage)
-        return damage
+    layers = []
+    for kind, points, fill, outline, width in prepared:
+        half = max(width, 1) / 2
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        left, right = math.floor(min(xs) - half) - min_x, math.ceil(max(xs) + half) - min_x
+        top, bottom = math.floor(min(ys) - half) - min_y, math.ceil(max(ys) + half) - min_y
+        x0, x1 = min(xs), max(xs)
+        y0, y1 = min(ys), max(ys)
+        segments = list(zip(points, points[1:] + (points[:1] if kind == "polygon" else [])))
+        layers.append((kind, points, fill, outline, half, max(left, 0), right, max(top, 0), bottom,
+                       (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2, segments))
     
-    def get_visual_shape(self):
-        """Override: Fire monster berbentuk flame/api"""
-        return "fire"
+    # Baris di luar, shape di dalam: urutan tumpukan per pixel tetap sama
+    for row, pixels in enumerate(rows):
+        py = row + min_y + 0.5
+        for (kind, points, fill, outline, half, left, right, top, bottom,
+             cx, cy, rx, ry, segments) in layers:
+            if not top <= row < bottom:
+                continue
+            if kind not in ("oval", "rectangle"):
+                # Hanya sisi yang cukup dekat dengan baris ini yang bisa mengenai pixel
+                near = [(a, b) for a, b in segments
+                        if min(a[1], b[1]) - half <= py <= max(a[1], b[1]) + half]
+                crossings = _scanline_crossings(py, points) if fill and kind == "polygon" else ()
+            for column in range(left, min(right, len(pixels))):
+                px = column + min_x + 0.5
+                color = None
+                if kind == "oval":
+                    def inside(grow):
+                        ax, ay = rx + grow, ry + grow
+                        return ax > 0 and ay > 0 and ((px - cx) / ax) ** 2 + ((py - cy) / ay) ** 2 <= 1
+                    if outline and inside(half) and not inside(-half):
+                        color = outline
+                    elif fill and inside(0):
+                        color = fill
+                elif kind == "rectangle":
+                    def inside(grow):
+                        return abs(px - cx) <= rx + grow and abs(py - cy) <= ry + grow
+                    if outline and inside(half) and not inside(-half):
+                        color = outline
+                    elif fill and inside(0):
+                        color = fill
+                else:
+                    if outline and any(_segment_distance(px, py, a[0], a[1], b[0], b[1]) <= half
+                                       for a, b in near):
+                        color = outline
+                    elif crossings and (len(crossings) - bisect.bisect_right(crossings, px)) % 2:
+                        color = fill
+                if color is not None:
+                    pixels[column] = color
+        yield row
+    return rows, min_x, min_y
+
+
+def rasterize(shapes, scale=1.0):
+    """Versi sekali jalan dari rasterize_steps(), mengembalikan (rows, offset_x, offset_y)"""
+    steps = rasterize_steps(shapes, scale)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
 
 
-class WaterMonster(Monster):
+class SpriteCache:
     """
-    Monster tipe Water - INHERITANCE dari Monster
-    Mendemonstrasikan POLYMORPHISM dengan override method attack()
-    Visual: Bentuk seperti tetesan air dengan gelombang
+    Cache PhotoImage per (bentuk, warna, scale)
+    Setiap species cukup dirasterisasi sekali, lalu digambar sebagai satu image item.
+    prewarm() mencicil rasterisasi beberapa baris per timer sehingga frame
+    pertama tidak menunggu; get() menyelesaikan sisanya jika sprite sudah dibutuhkan.
     """
-    def __init__(self, name="Aqualis"):
-        super().__init__(name, max_hp=120, attack_power=20, element="Water", color="#4444FF")
-    
-    def attack(self, target):
-        """Override: Serangan air dengan bonus damage ke Fire"""
-        base_damage = self.get_attack_power()
-        
-        # Polymorphism: Perilaku berbeda berdasarkan elemen target
-        if target.get_element() == "Fire":
-            damage = int(base_damage * 1.5)  # Super effective!
-        elif target.get_element() == "Earth":
-            damage = int(base_damage * 0.7)  # Not effective
-        else:
-            damage = base_damage
-        
-        target.take_damage(damage)
-        return damage
+    SLICE_MS = 8  # Budget rasterisasi per timer prewarm
+    
+    def __init__(self):
+        self.__sprites = {}
+        self.__jobs = {}  # key -> generator rasterize_steps yang belum selesai
+    
+    @staticmethod
+    def __key(monster, scale):
+        return (monster.get_visual_shape(), monster.get_color(), scale)
+    
+    def __job(self, key):
+        job = self.__jobs.get(key)
+        if job is None:
+            shape, color, scale = key
+            job = self.__jobs[key] = rasterize_steps(SHAPE_TEMPLATES[shape].shapes(color), scale)
+        return job
+    
+    def __step(self, key, deadline=None):
+        """Menjalankan job key sampai selesai (atau sampai deadline), True jika sprite siap"""
+        job = self.__job(key)
+        try:
+            while deadline is None or time.perf_counter() < deadline:
+                next(job)
+        except StopIteration as done:
+            rows, offset_x, offset_y = done.value
+            self.__sprites[key] = (self.__to_photo(rows), offset_x, offset_y)
+            del self.__jobs[key]
+            return True
+        return False
+    
+    def get(self, monster, scale=1.0):
+        """Mengembalikan tuple (PhotoImage, offset_x, offset_y)"""
+        key = self.__key(monster, scale)
+        sprite = self.__sprites.get(key)
+        if sprite is None:
+            self.__step(key)
+            sprite = self.__sprites[key]
+        return sprite
+    
+    def is_ready(self, monster, scale=1.0):
+        return self.__key(monster, scale) in self.__sprites
     
-    def special_attack(self, target):
-        """Special: Tsunami dengan damage besar"""
-        damage = int(self.get_attack_power() * 2.2)
-        target.take_damage(damage)
-        return damage
+    def prewarm(self, root, monsters, scale=1.0, on_ready=None, slice_ms=SLICE_MS):
+        """
+        Merasterisasi sprite monsters di background timer root.after, maksimal
+        slice_ms per timer. on_ready(monster) dipanggil saat sprite monster siap.
+        """
+        pending = deque(monsters)
+        
+        def work():
+            deadline = time.perf_counter() + slice_ms / 1000
+            while pending and time.perf_counter() < deadline:
+                monster = pending[0]
+                key = self.__key(monster, scale)
+                if key in self.__sprites or self.__step(key, deadline):
+                    pending.popleft()
+                    if on_ready is not None:
+                        on_ready(monster)
+            if pending:
+                try:
+                    root.after(1, work)
+                except tk.TclError:
+                    pass  # Root sudah dihancurkan
+        
+        work()
+    
+    def __to_photo(self, rows):
+        """Menyalin grid warna ke PhotoImage; pixel kosong tetap transparan"""
+        image = tk.PhotoImage(width=len(rows[0]), height=len(rows))
+        for y, pixels in enumerate(rows):
+            x = 0
+            while x < len(pixels):
+                if pixels[x] is None:
+                    x += 1
+                    continue
+                start = x
+                while x < len(pixels) and pixels[x] is not None:
+                    x += 1
+                image.put("{" + " ".join(pixels[start:x]) + "}", to=(start, y))
+        return image
+    
+    def clear(self):
+        self.__sprites.clear()
+        self.__jobs.clear()
     
-    def get_visual_shape(self):
-        """Override: Water monster berbentuk droplet"""
-        return "water"
+    def __len__(self):
+        return len(self.__sprites)
+
+
+SPRITE_CACHE = SpriteCache()
+
+
+# ==================== ANIMATION SCHEDULER ====================
+INSTANT = float("inf")  # Speed multiplier: semua animasi dan delay selesai seketika
+ANIMATION_SPEEDS = (1, 2, 4, INSTANT)
 
+# Keyframes (waktu ms, offset x) untuk monster yang menghadap ke kanan
+ATTACK_KEYFRAMES = ((0, 0), (60, 20), (200, 20), (260, 0))
+SHAKE_KEYFRAMES = ((0, 0), (25, 10), (75, -10), (125, 10), (150, 0))
 
-class EarthMonster(Monster):
+
+def _interpolate(keyframes, elapsed):
+    """Offset pada waktu elapsed dengan interpolasi linear antar keyframe"""
+    previous_time, previous_offset = keyframes[0]
+    for frame_time, offset in keyframes:
+        if elapsed <= frame_time:
+            if frame_time == previous_time:
+                return offset
+            fraction = (elapsed - previous_time) / (frame_time - previous_time)
+            return previous_offset + (offset - previous_offset) * fraction
+        previous_time, previous_offset = frame_time, offset
+    return previous_offset
+
+
+class Animator:
     """
-    Monster tipe Earth - INHERITANCE dari Monster
-    Mendemonstrasikan POLYMORPHISM dengan override method attack()
-    Visual: Bentuk seperti batu dengan tekstur
+    Satu animation loop dengan timestep tetap untuk seluruh GUI
+    - schedule(): callback tertunda (pengganti root.after) dalam waktu animasi
+    - play(): tween nilai target lewat keyframes; target adalah objek dengan
+      method set_offset(nilai), mis. MonsterVisual (offset x) atau HealthBar (lebar isi)
+    Setiap frame semua track di-tween lalu setiap target di-update sekali
+    (satu canvas.move / coords). Loop berhenti sendiri saat tidak ada pekerjaan.
     """
-    def __init__(self, name="Terrados"):
-        super().__init__(name, max_hp=140, attack_power=18, element="Earth", color="#44FF44")
-    
-    def attack(self, target):
-        """Override: Serangan tanah dengan bonus damage ke Water"""
-        base_damage = self.get_attack_power()
-        
-        # Polymorphism: Perilaku berbeda berdasarkan elemen target
-        if target.get_element() == "Water":
-            damage = int(base_damage * 1.5)  # Super effective!
-        elif target.get_element() == "Fire":
-            damage = int(base_damage * 0.7)  # Not effective
+    FRAME_MS = 16
+    MAX_INSTANT_STEPS = 10000  # Batas callback per frame pada speed INSTANT
+    
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.__speed = 1
+        self.__now = 0.0  # Waktu animasi (ms), maju frame_ms * speed setiap frame
+        self.__timers = []  # Heap (waktu, urutan, callback)
+        self.__sequence = itertools.count()
+        self.__tracks = []  # List (target, waktu mulai, keyframes)
+        self.__frame_end = []  # Callback sekali jalan di akhir frame berikutnya
+        self.__after_id = None
+    
+    def get_speed(self):
+        return self.__speed
+    
+    def set_speed(self, speed):
+        """Mengatur speed multiplier (1 = normal, INSTANT = tanpa jeda)"""
+        if speed <= 0:
+            raise ValueError("Animation speed must be positive")
+        self.__speed = speed
+    
+    def is_idle(self):
+        return not self.__timers and not self.__tracks
+    
+    def schedule(self, delay, callback):
+        """Menjalankan callback setelah delay ms waktu animasi"""
+        heapq.heappush(self.__timers, (self.__now + delay, next(self.__sequence), callback))
+        self.__start()
+    
+    def play(self, target, keyframes):
+        """Memulai track tween untuk target (nilai beberapa track dijumlahkan)"""
+        self.__tracks.append((target, self.__now, tuple(keyframes)))
+        self.__start()
+    
+    def at_frame_end(self, callback):
+        """Menjalankan callback sekali setelah frame berikutnya (untuk batch update widget)"""
+        self.__frame_end.append(callback)
+        self.__start()
+    
+    def stop(self, target):
+        """Menghentikan semua track milik target tanpa menerapkan nilai akhirnya"""
+        self.__tracks = [t for t in self.__tracks if t[0] is not target]
+    
+    def cancel_all(self):
+        """Membatalkan semua timer dan track (dipanggil saat screen dibersihkan)"""
+        if self.__after_id is not None:
+            self.root.after_cancel(self.__after_id)
+            self.__after_id = None
+        self.__timers.clear()
+        self.__tracks.clear()
+        self.__frame_end.clear()
+    
+    def flush(self, max_steps=MAX_INSTANT_STEPS):
+        """Menyelesaikan track dan timer yang tertunda sekarang juga"""
+        steps = 0
+        while not self.is_idle() and steps < max_steps:
+            # Lompat langsung ke kejadian berikutnya (timer atau akhir track)
+            ends = [start + keyframes[-1][0] for _, start, keyframes in self.__tracks]
+            if self.__timers:
+                ends.append(self.__timers[0][0])
+            self.__advance(max(0.0, min(ends) - self.__now))
+            steps += 1
+    
+    def __start(self):
+        if self.__after_id is None and (self.__frame_end or not self.is_idle()):
+            try:
+                self.__after_id = self.root.after(self.frame_ms, self.__tick)
+            except tk.TclError:
+                pass  # Root sudah dihancurkan
+    
+    def __tick(self):
+        self.__after_id = None
+        if self.__speed == INSTANT:
+            self.flush()
         else:
-            damage = base_damage
-        
-        target.take_damage(damage)
-        return damage
+            self.__advance(self.frame_ms * self.__speed)
+        callbacks, self.__frame_end = self.__frame_end, []
+        for callback in callbacks:
+            callback()
+        self.__start()
     
-    def special_attack(self, target):
-        """Special: Earthquake dengan damage area"""
-        damage = int(self.get_attack_power() * 2.3)
-        target.take_damage(damage)
-        return damage
+    def __advance(self, elapsed):
+        """Memajukan waktu animasi, menggambar track lalu menjalankan timer yang jatuh tempo"""
+        self.__now += elapsed
+        self.__render()
+        while self.__timers and self.__timers[0][0] <= self.__now:
+            _, _, callback = heapq.heappop(self.__timers)
+            callback()
     
-    def get_visual_shape(self):
-        """Override: Earth monster berbentuk rock/batu"""
-        return "earth"
+    def __render(self):
+        values = {}
+        active = []
+        for track in self.__tracks:
+            target, start, keyframes = track
+            elapsed = self.__now - start
+            values[target] = values.get(target, 0) + _interpolate(keyframes, elapsed)
+            if elapsed < keyframes[-1][0]:
+                active.append(track)
+        self.__tracks = active
+        
+        # Satu update canvas per target per frame
+        for target, value in values.items():
+            try:
+                target.set_offset(value)
+            except tk.TclError:
+                # Canvas sudah dihancurkan: buang track milik target ini
+                self.stop(target)
 
 
-# ==================== VISUAL MONSTER RENDERER ====================
-class MonsterVisual:
+# ==================== BATTLE LOG VIEW ====================
+class BattleLogView:
     """
-    Class untuk merender visual monster di canvas
-    Mendemonstrasikan composition dan encapsulation
+    Tampilan battle log di tk.Text dengan jumlah baris terbatas
+    - add() mengantre pesan, semua pesan satu frame ditulis dengan satu insert
+    - baris terlama dibuang saat melebihi max_lines
+    - page_older() memuat event lama dari BattleLog engine sesuai permintaan
     """
-    def __init__(self, canvas, x, y, monster, is_player=True):
-        self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.monster = monster
-        self.is_player = is_player
-        self.parts = []  # List untuk menyimpan ID objek canvas
-        self.animation_offset = 0
-        
-    def draw(self):
-        """Menggambar monster berdasarkan tipenya"""
-        shape_type = self.monster.get_visual_shape()
-        
-        if shape_type == "fire":
-            self.draw_fire_monster()
-        elif shape_type == "water":
-            self.draw_water_monster()
-        elif shape_type == "earth":
-            self.draw_earth_monster()
-    
-    def draw_fire_monster(self):
-        """Menggambar Fire Monster - bentuk api"""
-        color = self.monster.get_color()
-        
-        # Body - lingkaran besar
-        body = self.canvas.create_oval(
-            self.x - 40, self.y - 40,
-            self.x + 40, self.y + 40,
-            fill=color, outline="#CC0000", width=3
-        )
-        self.parts.append(body)
-        
-        # Inner glow
-        inner = self.canvas.create_oval(
-            self.x - 25, self.y - 25,
-            self.x + 25, self.y + 25,
-            fill="#FF8844", outline=""
-        )
-        self.parts.append(inner)
-        
-        # Flames (lidah api) - 3 buah
-        for i in range(3):
-            angle = (i - 1) * 40
-            flame_x = self.x + math.cos(math.radians(270 + angle)) * 30
-            flame_y = self.y + math.sin(math.radians(270 + angle)) * 30
-            
-            flame = self.canvas.create_polygon(
-                flame_x, flame_y - 25,
-                flame_x - 10, flame_y,
-                flame_x + 10, flame_y,
-                fill="#FFAA00", outline="#FF4400", width=2
-            )
-            self.parts.append(flame)
-        
-        # Eyes
-        eye1 = self.canvas.create_oval(
-            self.x - 15, self.y - 10,
-            self.x - 5, self.y,
-            fill="#FFFF00", outline="black"
-        )
-        eye2 = self.canvas.create_oval(
-            self.x + 5, self.y - 10,
-            self.x + 15, self.y,
-            fill="#FFFF00", outline="black"
-        )
-        self.parts.extend([eye1, eye2])
-        
-        # Pupils
-        pupil1 = self.canvas.create_oval(
-            self.x - 12, self.y - 7,
-            self.x - 8, self.y - 3,
-            fill="black"
-        )
-        pupil2 = self.canvas.create_oval(
-            self.x + 8, self.y - 7,
-            self.x + 12, self.y - 3,
-            fill="black"
-        )
-        self.parts.extend([pupil1, pupil2])
-    
-    def draw_water_monster(self):
-        """Menggambar Water Monster - bentuk droplet"""
-        color = self.monster.get_color()
-        
-        # Body - bentuk tetesan air
-        body = self.canvas.create_polygon(
-            self.x, self.y - 50,  # Top point
-            self.x - 35, self.y,
-            self.x - 30, self.y + 20,
-            self.x, self.y + 35,  # Bottom
-            self.x + 30, self.y + 20,
-            self.x + 35, self.y,
-            fill=color, outline="#0000CC", width=3, smooth=True
-        )
-        self.parts.append(body)
-        
-        # Inner highlight (white shine)
-        highlight = self.canvas.create_oval(
-            self.x - 15, self.y - 20,
-            self.x + 5, self.y,
-            fill="#AACCFF", outline=""
-        )
-        self.parts.append(highlight)
-        
-        # Waves (gelombang) - 3 garis bergelombang
-        for i in range(3):
-            wave_y = self.y - 10 + (i * 15)
-            wave = self.canvas.create_line(
-                self.x - 20, wave_y,
-                self.x - 10, wave_y - 5,
-                self.x, wave_y,
-                self.x + 10, wave_y - 5,
-                self.x + 20, wave_y,
-                fill="#6688FF", width=2, smooth=True
-            )
-            self.parts.append(wave)
-        
-        # Eyes
-        eye1 = self.canvas.create_oval(
-            self.x - 15, self.y,
-            self.x - 5, self.y + 10,
-            fill="white", outline="black"
-        )
-        eye2 = self.canvas.create_oval(
-            self.x + 5, self.y,
-            self.x + 15, self.y + 10,
-            fill="white", outline="black"
-        )
-        self.parts.extend([eye1, eye2])
-        
-        # Pupils
-        pupil1 = self.canvas.create_oval(
-            self.x - 12, self.y + 3,
-            self.x - 8, self.y + 7,
-            fill="#000088"
-        )
-        pupil2 = self.canvas.create_oval(
-            self.x + 8, self.y + 3,
-            self.x + 12, self.y + 7,
-            fill="#000088"
-        )
-        self.parts.extend([pupil1, pupil2])
-    
-    def draw_earth_monster(self):
-        """Menggambar Earth Monster - bentuk batu"""
-        color = self.monster.get_color()
-        
-        # Body - bentuk batu (hexagon tidak beraturan)
-        body = self.canvas.create_polygon(
-            self.x, self.y - 45,
-            self.x + 40, self.y - 20,
-            self.x + 35, self.y + 30,
-            self.x, self.y + 40,
-            self.x - 35, self.y + 30,
-            self.x - 40, self.y - 20,
-            fill=color, outline="#228800", width=3
-        )
-        self.parts.append(body)
-        
-        # Cracks (retakan batu) - garis-garis
-        crack1 = self.canvas.create_line(
-            self.x - 20, self.y - 30,
-            self.x - 10, self.y,
-            self.x - 15, self.y + 20,
-            fill="#116600", width=2
-        )
-        crack2 = self.canvas.create_line(
-            self.x + 15, self.y - 25,
-            self.x + 10, self.y + 5,
-            self.x + 20, self.y + 25,
-            fill="#116600", width=2
-        )
-        self.parts.extend([crack1, crack2])
-        
-        # Moss patches (lumut)
-        moss1 = self.canvas.create_oval(
-            self.x - 25, self.y + 15,
-            self.x - 10, self.y + 25,
-            fill="#338833", outline=""
-        )
-        moss2 = self.canvas.create_oval(
-            self.x + 10, self.y - 10,
-            self.x + 20, self.y,
-            fill="#338833", outline=""
-        )
-        self.parts.extend([moss1, moss2])
-        
-        # Eyes (lebih kotak untuk kesan batu)
-        eye1 = self.canvas.create_rectangle(
-            self.x - 15, self.y - 5,
-            self.x - 5, self.y + 5,
-            fill="#88FF88", outline="black", width=2
-        )
-        eye2 = self.canvas.create_rectangle(
-            self.x + 5, self.y - 5,
-            self.x + 15, self.y + 5,
-            fill="#88FF88", outline="black", width=2
-        )
-        self.parts.extend([eye1, eye2])
-        
-        # Pupils
-        pupil1 = self.canvas.create_rectangle(
-            self.x - 12, self.y - 2,
-            self.x - 8, self.y + 2,
-            fill="#004400"
-        )
-        pupil2 = self.canvas.create_rectangle(
-            self.x + 8, self.y - 2,
-            self.x + 12, self.y + 2,
-            fill="#004400"
-        )
-        self.parts.extend([pupil1, pupil2])
+    MAX_LINES = 50
+    PAGE_SIZE = 20
     
-    def animate_attack(self):
-        """Animasi saat monster menyerang"""
-        # Geser monster sedikit ke depan
-        move_x = 20 if self.is_player else -20
-        for part in self.parts:
-            self.canvas.move(part, move_x, 0)
-        
-        # Kembali ke posisi awal setelah delay
-        self.canvas.after(200, lambda: self.reset_position(move_x))
+    def __init__(self, text, get_log, animator=None, max_lines=MAX_LINES):
+        self.text = text
+        self.get_log = get_log  # Callable yang mengembalikan BattleLog engine saat ini
+        self.animator = animator
+        self.max_lines = max_lines
+        self.__pending = []  # Pesan yang belum ditulis ke widget
+        self.__flush_scheduled = False
+        self.__line_events = deque()  # Index event engine per baris widget (None = bukan event)
     
-    def reset_position(self, move_x):
-        """Reset posisi setelah animasi"""
-        for part in self.parts:
-            self.canvas.move(part, -move_x, 0)
+    def get_line_count(self):
+        return len(self.__line_events)
     
-    def shake(self):
-        """Animasi shake saat terkena damage"""
-        for i in range(3):
-            offset = 10 if i % 2 == 0 else -10
-            self.canvas.after(i * 50, lambda o=offset: self.apply_shake(o))
-        self.canvas.after(150, lambda: self.apply_shake(0))
-    
-    def apply_shake(self, offset):
-        """Apply shake offset"""
-        if len(self.parts) > 0:
-            current_x = self.canvas.coords(self.parts[0])[0]
-            for part in self.parts:
-                self.canvas.move(part, offset - self.animation_offset, 0)
-            self.animation_offset = offset
+    def add(self, message, event_index=None):
+        """Mengantre satu pesan (event_index: index global event di BattleLog)"""
+        self.__pending.append((message, event_index))
+        if self.animator is None:
+            self.flush()
+        elif not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            self.animator.at_frame_end(self.flush)
+    
+    def flush(self):
+        """Menulis semua pesan yang diantre lalu memangkas baris lama"""
+        self.__flush_scheduled = False
+        if not self.__pending:
+            return
+        lines = []
+        for message, event_index in self.__pending:
+            for line in message.split("\n"):
+                lines.append(line)
+                self.__line_events.append(event_index)
+        self.__pending.clear()
+        
+        excess = len(self.__line_events) - self.max_lines
+        self.text.config(state="normal")
+        self.text.insert("end", "\n".join(lines) + "\n")
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+            for _ in range(excess):
+                self.__line_events.popleft()
+        self.text.see("end")
+        self.text.config(state="disabled")
+    
+    def page_older(self, count=PAGE_SIZE):
+        """
+        Menambahkan count event sebelum baris event tertua di atas widget.
+        Mengembalikan jumlah event yang dimuat (0 jika sudah habis di buffer).
+        """
+        self.flush()
+        log = self.get_log()
+        oldest = next((i for i in self.__line_events if i is not None), log.get_total())
+        events = log.events(oldest - count, oldest)
+        if not events:
+            return 0
+        self.text.config(state="normal")
+        self.text.insert("1.0", "\n".join(format_event(e) for e in events) + "\n")
+        self.text.see("1.0")
+        self.text.config(state="disabled")
+        first = oldest - len(events)
+        self.__line_events.extendleft(reversed(range(first, oldest)))
+        return len(events)
     
     def clear(self):
-        """Hapus semua parts dari canvas"""
-        for part in self.parts:
-            self.canvas.delete(part)
-        self.parts = []
+        """Mengosongkan widget dan antrean (battle baru)"""
+        self.__pending.clear()
+        self.__flush_scheduled = False
+        self.__line_events.clear()
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.config(state="disabled")
 
 
-# ==================== GAME CONTROLLER ====================
-class BattleGame:
+# ==================== WIN PROBABILITY WORKER ====================
+class WinProbabilityWorker:
     """
-    Controller untuk mengatur logika game
-    Mendemonstrasikan composition dan encapsulation
+    Menghitung peluang menang (attack, special) di thread background
+    Request dan hasil lewat queue.Queue; hasil dibaca di thread Tk dengan
+    polling root.after sehingga UI tidak pernah menunggu solver. Hasil
+    di-cache per state, jadi posisi yang sama tidak dihitung ulang.
     """
-    def __init__(self):
-        self.__player_monster = None
-        self.__enemy_monster = None
-        self.__battle_log = []
-        self.__wins = 0
-        self.__losses = 0
-    
-    def set_player_monster(self, monster_type):
-        """Memilih monster pemain"""
-        if monster_type == "Fire":
-            self.__player_monster = FireMonster("Your Flameo")
-        elif monster_type == "Water":
-            self.__player_monster = WaterMonster("Your Aqualis")
-        elif monster_type == "Earth":
-            self.__player_monster = EarthMonster("Your Terrados")
-    
-    def create_enemy_monster(self):
-        """Membuat monster musuh secara random"""
-        monster_types = [FireMonster, WaterMonster, EarthMonster]
-        enemy_class = random.choice(monster_types)
-        self.__enemy_monster = enemy_class("Enemy " + enemy_class.__name__.replace("Monster", ""))
-    
-    def get_player_monster(self):
-        return self.__player_monster
-    
-    def get_enemy_monster(self):
-        return self.__enemy_monster
-    
-    def player_attack(self, is_special=False):
-        """Pemain menyerang musuh"""
-        if is_special:
-            damage = self.__player_monster.special_attack(self.__enemy_monster)
-            attack_type = "SPECIAL ATTACK"
-        else:
-            damage = self.__player_monster.attack(self.__enemy_monster)
-            attack_type = "ATTACK"
-        
-        log = f"{self.__player_monster.get_name()} uses {attack_type}! Deals {damage} damage!"
-        self.__battle_log.append(log)
-        return log
+    POLL_MS = 30
     
-    def enemy_attack(self):
-        """Musuh menyerang pemain"""
-        is_special = random.random() < 0.3
-        
-        if is_special:
-            damage = self.__enemy_monster.special_attack(self.__player_monster)
-            attack_type = "SPECIAL ATTACK"
-        else:
-            damage = self.__enemy_monster.attack(self.__player_monster)
-            attack_type = "ATTACK"
-        
-        log = f"{self.__enemy_monster.get_name()} uses {attack_type}! Deals {damage} damage!"
-        self.__battle_log.append(log)
-        return log
-    
-    def check_battle_end(self):
-        """Mengecek apakah battle sudah selesai"""
-        if not self.__player_monster.is_alive():
-            self.__losses += 1
-            return "lose"
-        elif not self.__enemy_monster.is_alive():
-            self.__wins += 1
-            return "win"
-        return None
+    def __init__(self, root, poll_ms=POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.__requests = queue.Queue()
+        self.__results = queue.Queue()
+        self.__cache = {}  # state -> (peluang attack, peluang special); hanya disentuh thread Tk
+        self.__waiting = {}  # state -> callback yang menunggu hasil
+        self.__thread = None
+        self.__after_id = None
+    
+    def get_cached(self, state):
+        return self.__cache.get(state)
     
-    def get_stats(self):
-        """Mendapatkan statistik win/lose"""
-        return self.__wins, self.__losses
+    def request(self, state, callback):
+        """
+        Meminta peluang menang untuk state
+        (player_type, enemy_type, player_hp, enemy_hp, enemy_special_chance).
+        callback(state, (attack, special)) dipanggil di thread Tk; langsung jika sudah di-cache.
+        Jika solver gagal, callback menerima odds None.
+        """
+        cached = self.__cache.get(state)
+        if cached is not None:
+            callback(state, cached)
+            return
+        if state not in self.__waiting:
+            self.__requests.put(state)
+        self.__waiting[state] = callback
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="win-probability", daemon=True)
+            self.__thread.start()
+        self.__start_polling()
     
-    def reset_battle(self):
-        """Reset battle untuk pertarungan baru"""
-        self.__player_monster = None
-        self.__enemy_monster = None
-        self.__battle_log = []
+    def close(self):
+        """Menghentikan thread worker dan polling"""
+        if self.__after_id is not None:
+            try:
+                self.root.after_cancel(self.__after_id)
+            except tk.TclError:
+                pass  # Root sudah dihancurkan
+            self.__after_id = None
+        self.__waiting.clear()
+        if self.__thread is not None:
+            self.__requests.put(None)
+            self.__thread = None
+    
+    def __run(self):
+        """Loop thread worker: satu request, satu hasil"""
+        while True:
+            state = self.__requests.get()
+            if state is None:
+                return
+            try:
+                player_type, enemy_type, player_hp, enemy_hp, enemy_chance = state
+                normal, special = action_values(player_type, enemy_type, player_hp, enemy_hp,
+                                                enemy_special_chance=enemy_chance)
+                odds = (normal.win_probability, special.win_probability)
+            except Exception:
+                odds = None  # Thread tetap hidup; state ini dilepas dari daftar tunggu
+            self.__results.put((state, odds))
+    
+    def __start_polling(self):
+        if self.__after_id is None:
+            try:
+                self.__after_id = self.root.after(self.poll_ms, self.__poll)
+            except tk.TclError:
+                pass  # Root sudah dihancurkan
+    
+    def __poll(self):
+        self.__after_id = None
+        while True:
+            try:
+                state, odds = self.__results.get_nowait()
+            except queue.Empty:
+                break
+            if odds is not None:
+                self.__cache[state] = odds
+            callback = self.__waiting.pop(state, None)
+            if callback is not None:
+                callback(state, odds)
+        if self.__waiting:
+            self.__start_polling()
 
 
 # ==================== GUI APPLICATION ====================
@@ -537,30 +885,74 @@ class MonsterBattleGUI:
     """
     GUI Application menggunakan Tkinter dengan Visual Monster
     """
-    def __init__(self, root):
+    def __init__(self, root, render_mode="vector", hp_drain=True, stats_store=None, show_odds=True):
         self.root = root
+        self.render_mode = render_mode  # "sprite" memakai PhotoImage yang di-cache
+        self.hp_drain = hp_drain  # Animasi drain HP bar saat terkena damage
+        self.show_odds = show_odds  # Overlay peluang menang attack vs special di arena
         self.root.title("Monster Battle Arena - Visual Edition")
         self.root.geometry("900x700")
         self.root.configure(bg="#1a1a2e")
         
         self.game = BattleGame()
+        self.stats_store = stats_store  # StatsStore (monster_stats) untuk stats permanen
+        self.game.set_stats_store(stats_store)
         self.player_visual = None
         self.enemy_visual = None
-        
+        self.replay_choices = None  # Iterator pilihan saat memutar recording
+        self.saved_game = None  # Game asli (stats) selama replay
+        self.animator = Animator(root)  # Satu loop untuk semua animasi dan delay giliran
+        self.difficulty = "easy"  # Key DIFFICULTIES (easy = musuh acak seperti semula)
+        self.odds_worker = WinProbabilityWorker(root)
+        self.odds_state = None  # State yang sedang ditampilkan overlay
+        self.sprites_prewarming = False  # Sprite cache sedang diisi bertahap (mode sprite)
+        self.on_previews_drawn = None  # Callback sekali saat semua preview menu tergambar
+        
+        # Screen dibuat sekali lalu ditukar (pack/pack_forget), bukan dihancurkan
+        self.menu_screen = None
+        self.battle_screen = None
+        self.current_screen = None
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.create_menu_screen()
     
+    def close(self):
+        """Menghentikan animasi dan worker peluang menang lalu menutup window"""
+        self.animator.cancel_all()
+        self.odds_worker.close()
+        self.root.destroy()
+    
     def clear_screen(self):
-        """Membersihkan semua widget dari screen"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        """Menyembunyikan screen aktif dan membatalkan animasi yang tertunda"""
+        self.animator.cancel_all()  # Timer lama tidak boleh jalan pada battle yang sudah selesai
+        if self.current_screen is not None:
+            self.current_screen.pack_forget()
+            self.current_screen = None
     
-    def create_menu_screen(self):
-        """Membuat menu utama"""
+    def show_screen(self, screen):
+        """Menampilkan screen yang sudah dibuat"""
         self.clear_screen()
+        screen.pack(fill="both", expand=True)
+        self.current_screen = screen
+    
+    def create_menu_screen(self):
+        """Menampilkan menu utama (dibuat sekali, hanya stats yang di-update)"""
+        if self.menu_screen is None:
+            self.build_menu_screen()
+        if self.stats_store is not None:
+            wins, losses = self.stats_store.get_totals()  # Dari cache store, tanpa query
+        else:
+            wins, losses = self.game.get_stats()
+        self.stats_label.config(text=f"Stats - Wins: {wins} | Losses: {losses}")
+        self.show_screen(self.menu_screen)
+    
+    def build_menu_screen(self):
+        """Membuat semua widget menu utama"""
+        screen = self.menu_screen = tk.Frame(self.root, bg="#1a1a2e")
         
         # Title
         title = tk.Label(
-            self.root, 
+            screen, 
             text="MONSTER BATTLE ARENA", 
             font=("Arial", 32, "bold"),
             bg="#1a1a2e",
@@ -569,7 +961,7 @@ class MonsterBattleGUI:
         title.pack(pady=30)
         
         subtitle = tk.Label(
-            self.root,
+            screen,
             text="Choose Your Monster!",
             font=("Arial", 18),
             bg="#1a1a2e",
@@ -578,7 +970,7 @@ class MonsterBattleGUI:
         subtitle.pack(pady=10)
         
         # Preview canvas untuk menampilkan monster
-        preview_frame = tk.Frame(self.root, bg="#1a1a2e")
+        preview_frame = tk.Frame(screen, bg="#1a1a2e")
         preview_frame.pack(pady=20)
         
         # Fire preview
@@ -588,10 +980,9 @@ class MonsterBattleGUI:
         fire_canvas = tk.Canvas(fire_frame, width=150, height=150, bg="#0f3460", highlightthickness=0)
         fire_canvas.pack(pady=10)
         
-        # Draw fire monster preview
-        temp_fire = FireMonster()
-        fire_vis = MonsterVisual(fire_canvas, 75, 75, temp_fire)
-        fire_vis.draw()
+        # Fire monster preview (cukup species, tanpa membuat Monster)
+        self.menu_previews = [MonsterVisual(fire_canvas, 75, 75, get_species("Fire"),
+                                            render_mode=self.render_mode)]
         
         fire_btn = tk.Button(
             fire_frame,
@@ -612,9 +1003,8 @@ class MonsterBattleGUI:
         water_canvas = tk.Canvas(water_frame, width=150, height=150, bg="#0f3460", highlightthickness=0)
         water_canvas.pack(pady=10)
         
-        temp_water = WaterMonster()
-        water_vis = MonsterVisual(water_canvas, 75, 75, temp_water)
-        water_vis.draw()
+        self.menu_previews.append(MonsterVisual(water_canvas, 75, 75, get_species("Water"),
+                                                render_mode=self.render_mode))
         
         water_btn = tk.Button(
             water_frame,
@@ -635,9 +1025,8 @@ class MonsterBattleGUI:
         earth_canvas = tk.Canvas(earth_frame, width=150, height=150, bg="#0f3460", highlightthickness=0)
         earth_canvas.pack(pady=10)
         
-        temp_earth = EarthMonster()
-        earth_vis = MonsterVisual(earth_canvas, 75, 75, temp_earth)
-        earth_vis.draw()
+        self.menu_previews.append(MonsterVisual(earth_canvas, 75, 75, get_species("Earth"),
+                                                render_mode=self.render_mode))
         
         earth_btn = tk.Button(
             earth_frame,
@@ -651,30 +1040,139 @@ class MonsterBattleGUI:
         )
         earth_btn.pack(pady=10)
         
-        # Stats
-        wins, losses = self.game.get_stats()
-        stats = tk.Label(
-            self.root,
-            text=f"Stats - Wins: {wins} | Losses: {losses}",
+        # Stats (teks di-update setiap kembali ke menu)
+        self.stats_label = tk.Label(
+            screen,
             font=("Arial", 16, "bold"),
             bg="#1a1a2e",
             fg="#ffaa00"
         )
-        stats.pack(pady=20)
+        self.stats_label.pack(pady=20)
+        
+        # Tingkat kesulitan AI musuh
+        self.difficulty_btn = tk.Button(
+            screen,
+            text=self.difficulty_label(),
+            font=("Arial", 12, "bold"),
+            bg="#16213e",
+            fg="white",
+            width=20,
+            command=self.cycle_difficulty
+        )
+        self.difficulty_btn.pack()
+        
+        # Preview digambar saat canvas-nya pertama kali di-expose, yaitu sesudah window
+        # tampil (timer after(0) masih jalan sebelum Tk menggambar window di idle callback)
+        for visual in self.menu_previews:
+            visual.canvas.bind("<Expose>", lambda event, visual=visual: self.draw_menu_preview(visual))
+    
+    def draw_menu_preview(self, visual):
+        """Menggambar satu monster preview di menu (sekali saja)"""
+        if visual.parts:
+            return
+        if self.render_mode == "sprite" and not SPRITE_CACHE.is_ready(visual.monster, visual.scale):
+            # Rasterisasi dicicil lewat timer; preview digambar saat sprite-nya siap
+            if not self.sprites_prewarming:
+                self.sprites_prewarming = True
+                SPRITE_CACHE.prewarm(self.root, [v.monster for v in self.menu_previews],
+                                     visual.scale, on_ready=self.on_sprite_ready)
+            return
+        visual.draw()
+        if self.on_previews_drawn is not None and all(v.parts for v in self.menu_previews):
+            callback, self.on_previews_drawn = self.on_previews_drawn, None
+            callback()
+    
+    def on_sprite_ready(self, monster):
+        """Callback prewarm: gambar preview yang menunggu sprite monster ini"""
+        for visual in self.menu_previews:
+            if visual.monster is monster:
+                self.draw_menu_preview(visual)
+    
+    def difficulty_label(self):
+        """Teks tombol tingkat kesulitan"""
+        return f"🤖 AI: {self.difficulty.title()}"
+    
+    def set_difficulty(self, difficulty):
+        """Mengatur AI musuh (lihat monster_ai.DIFFICULTIES)"""
+        self.difficulty = difficulty
+        ai = EnemyAI(difficulty) if DIFFICULTIES[difficulty] is not None else None
+        self.game.set_enemy_ai(ai)
+        self.difficulty_btn.config(text=self.difficulty_label())
+    
+    def cycle_difficulty(self):
+        """Ganti ke tingkat kesulitan berikutnya"""
+        levels = list(DIFFICULTIES)
+        self.set_difficulty(levels[(levels.index(self.difficulty) + 1) % len(levels)])
     
     def start_battle(self, monster_type):
         """Memulai battle dengan monster yang dipilih"""
+        self.game.set_seed()  # RNG per battle agar bisa direkam dan di-replay
         self.game.set_player_monster(monster_type)
         self.game.create_enemy_monster()
         self.create_battle_screen()
     
+    def start_replay(self, recording):
+        """Memutar recording (lihat monster_replay) dengan animasi"""
+        self.saved_game = self.game
+        self.game = BattleGame(seed=recording.seed)  # Replay tidak mengubah stats
+        self.game.set_player_monster(recording.player_type)
+        self.game.create_enemy_monster(recording.enemy_type)
+        self.replay_choices = iter(recording.choices)
+        self.create_battle_screen()
+        self.disable_buttons()
+        self.animator.schedule(1000, self.replay_turn)
+    
+    def replay_turn(self):
+        """Menjalankan giliran pemain berikutnya dari recording"""
+        if next(self.replay_choices, 0):
+            self.player_special_attack()
+        else:
+            self.player_normal_attack()
+    
     def create_battle_screen(self):
-        """Membuat screen battle dengan visual monster"""
-        self.clear_screen()
+        """Menampilkan screen battle untuk battle baru (dibuat sekali, hanya bagian dinamis yang di-reset)"""
+        if self.battle_screen is None:
+            self.build_battle_screen()
+        self.show_screen(self.battle_screen)
+        
+        # Ganti visual monster di canvas arena yang sama
+        if self.player_visual is not None:
+            self.player_visual.clear()
+            self.enemy_visual.clear()
+        
+        player = self.game.get_player_monster()
+        enemy = self.game.get_enemy_monster()
+        
+        self.player_visual = MonsterVisual(self.arena_canvas, 150, 125, player, is_player=True,
+                                           render_mode=self.render_mode, animator=self.animator)
+        self.player_visual.draw()
+        
+        self.enemy_visual = MonsterVisual(self.arena_canvas, 650, 125, enemy, is_player=False,
+                                          render_mode=self.render_mode, animator=self.animator)
+        self.enemy_visual.draw()
+        
+        self.player_name_label.config(text=player.get_name())
+        self.player_element_label.config(text=f"🔥 {player.get_element()}")
+        self.enemy_name_label.config(text=enemy.get_name())
+        self.enemy_element_label.config(text=f"🔥 {enemy.get_element()}")
+        
+        self.log_view.clear()
+        
+        self.return_btn.pack_forget()
+        self.speed_btn.config(text=self.speed_label())
+        self.enable_buttons()
+        
+        # Update display (monster baru: bar langsung penuh tanpa drain)
+        self.update_battle_display(animate=False)
+        self.add_battle_log("⚔️ Battle Start! Choose your action!")
+    
+    def build_battle_screen(self):
+        """Membuat semua widget screen battle"""
+        screen = self.battle_screen = tk.Frame(self.root, bg="#1a1a2e")
         
         # Title
         title = tk.Label(
-            self.root,
+            screen,
             text="⚔️ BATTLE! ⚔️",
             font=("Arial", 24, "bold"),
             bg="#1a1a2e",
@@ -683,7 +1181,7 @@ class MonsterBattleGUI:
         title.pack(pady=10)
         
         # Battle arena canvas
-        arena_frame = tk.Frame(self.root, bg="#16213e", relief="sunken", borderwidth=5)
+        arena_frame = tk.Frame(screen, bg="#16213e", relief="sunken", borderwidth=5)
         arena_frame.pack(pady=10)
         
         self.arena_canvas = tk.Canvas(
@@ -695,43 +1193,40 @@ class MonsterBattleGUI:
         )
         self.arena_canvas.pack()
         
-        # Draw monsters
-        player = self.game.get_player_monster()
-        enemy = self.game.get_enemy_monster()
-        
-        self.player_visual = MonsterVisual(self.arena_canvas, 150, 125, player, is_player=True)
-        self.player_visual.draw()
-        
-        self.enemy_visual = MonsterVisual(self.arena_canvas, 650, 125, enemy, is_player=False)
-        self.enemy_visual.draw()
+        # Overlay peluang menang (satu item teks, di-update lewat itemconfig)
+        self.odds_text = self.arena_canvas.create_text(
+            400, 16,
+            font=("Arial", 12, "bold"),
+            fill="#ffdd00",
+            state="hidden"
+        )
         
         # Info panel
-        info_frame = tk.Frame(self.root, bg="#1a1a2e")
+        info_frame = tk.Frame(screen, bg="#1a1a2e")
         info_frame.pack(pady=10)
         
         # Player info
         player_frame = tk.Frame(info_frame, bg="#16213e", relief="raised", borderwidth=3)
         player_frame.grid(row=0, column=0, padx=20)
         
-        tk.Label(
+        self.player_name_label = tk.Label(
             player_frame,
-            text=player.get_name(),
             font=("Arial", 14, "bold"),
             bg="#16213e",
             fg="#00ff88"
-        ).pack(pady=5)
+        )
+        self.player_name_label.pack(pady=5)
         
-        tk.Label(
+        self.player_element_label = tk.Label(
             player_frame,
-            text=f"🔥 {player.get_element()}",
             font=("Arial", 11),
             bg="#16213e",
             fg="white"
-        ).pack()
+        )
+        self.player_element_label.pack()
         
         self.player_hp_label = tk.Label(
             player_frame,
-            text=f"HP: {player.get_current_hp()}/{player.get_max_hp()}",
             font=("Arial", 11),
             bg="#16213e",
             fg="white"
@@ -745,25 +1240,24 @@ class MonsterBattleGUI:
         enemy_frame = tk.Frame(info_frame, bg="#16213e", relief="raised", borderwidth=3)
         enemy_frame.grid(row=0, column=1, padx=20)
         
-        tk.Label(
+        self.enemy_name_label = tk.Label(
             enemy_frame,
-            text=enemy.get_name(),
             font=("Arial", 14, "bold"),
             bg="#16213e",
             fg="#ff4444"
-        ).pack(pady=5)
+        )
+        self.enemy_name_label.pack(pady=5)
         
-        tk.Label(
+        self.enemy_element_label = tk.Label(
             enemy_frame,
-            text=f"🔥 {enemy.get_element()}",
             font=("Arial", 11),
             bg="#16213e",
             fg="white"
-        ).pack()
+        )
+        self.enemy_element_label.pack()
         
         self.enemy_hp_label = tk.Label(
             enemy_frame,
-            text=f"HP: {enemy.get_current_hp()}/{enemy.get_max_hp()}",
             font=("Arial", 11),
             bg="#16213e",
             fg="white"
@@ -773,9 +1267,13 @@ class MonsterBattleGUI:
         self.enemy_hp_bar = tk.Canvas(enemy_frame, width=200, height=20, bg="#333333")
         self.enemy_hp_bar.pack(pady=5, padx=10, ipadx=5, ipady=5)
         
+        # Item HP bar dibuat sekali, update berikutnya hanya coords/itemconfig
+        self.player_health = HealthBar(self.player_hp_bar, self.player_hp_label, animator=self.animator)
+        self.enemy_health = HealthBar(self.enemy_hp_bar, self.enemy_hp_label, animator=self.animator)
+        
         # Battle log
         self.battle_log = tk.Text(
-            self.root,
+            screen,
             height=6,
             width=80,
             font=("Courier", 10),
@@ -784,9 +1282,10 @@ class MonsterBattleGUI:
             state="disabled"
         )
         self.battle_log.pack(pady=10)
+        self.log_view = BattleLogView(self.battle_log, lambda: self.game.get_battle_log(), self.animator)
         
         # Action buttons
-        action_frame = tk.Frame(self.root, bg="#1a1a2e")
+        action_frame = tk.Frame(screen, bg="#1a1a2e")
         action_frame.pack(pady=10)
         
         self.attack_btn = tk.Button(
@@ -813,39 +1312,140 @@ class MonsterBattleGUI:
         )
         self.special_btn.grid(row=0, column=1, padx=10)
         
-        # Update display
-        self.update_battle_display()
-        self.add_battle_log("⚔️ Battle Start! Choose your action!")
+        self.speed_btn = tk.Button(
+            action_frame,
+            text=self.speed_label(),
+            font=("Arial", 13, "bold"),
+            bg="#4444ff",
+            fg="white",
+            width=8,
+            height=2,
+            command=self.cycle_animation_speed
+        )
+        self.speed_btn.grid(row=0, column=2, padx=10)
+        
+        self.older_btn = tk.Button(
+            action_frame,
+            text="📜 OLDER",
+            font=("Arial", 13, "bold"),
+            bg="#16213e",
+            fg="white",
+            width=8,
+            height=2,
+            command=self.show_older_log
+        )
+        self.older_btn.grid(row=0, column=3, padx=10)
+        
+        self.odds_btn = tk.Button(
+            action_frame,
+            text="📊 ODDS",
+            font=("Arial", 13, "bold"),
+            bg="#16213e",
+            fg="white",
+            width=8,
+            height=2,
+            command=self.toggle_odds
+        )
+        self.odds_btn.grid(row=0, column=4, padx=10)
+        
+        # Return button (ditampilkan oleh end_battle)
+        self.return_btn = tk.Button(
+            screen,
+            text="Return to Menu",
+            font=("Arial", 14, "bold"),
+            bg="#4444ff",
+            fg="white",
+            width=20,
+            height=2,
+            command=self.return_to_menu
+        )
     
-    def update_battle_display(self):
-        """Update tampilan HP dan health bar"""
+    def update_battle_display(self, animate=None):
+        """Update tampilan HP dan health bar (hanya yang berubah)"""
+        if animate is None:
+            animate = self.hp_drain
         player = self.game.get_player_monster()
         enemy = self.game.get_enemy_monster()
+        self.player_health.set_hp(player.get_current_hp(), player.get_max_hp(), animate)
+        self.enemy_health.set_hp(enemy.get_current_hp(), enemy.get_max_hp(), animate)
+        self.update_win_odds()
+    
+    def update_win_odds(self):
+        """
+        Meminta peluang menang untuk state sekarang ke worker (tidak memblok).
+        Peluang special musuh mengikuti difficulty AI (enemy_special_chance);
+        pada giliran musuh overlay hanya diredupkan sampai giliran pemain berikutnya.
+        """
+        if not self.show_odds:
+            self.arena_canvas.itemconfig(self.odds_text, state="hidden")
+            return
+        game = self.game
+        player = game.get_player_monster()
+        enemy = game.get_enemy_monster()
+        if not player.is_alive() or not enemy.is_alive():
+            self.odds_state = None
+            self.arena_canvas.itemconfig(self.odds_text, state="hidden")
+            return
+        log = game.get_battle_log()
+        total = log.get_total()
+        if total and log.events(total - 1)[0].actor == "player":
+            self.arena_canvas.itemconfig(self.odds_text, fill="#777777")
+            return
         
-        # Update player HP
-        self.player_hp_label.config(
-            text=f"HP: {player.get_current_hp()}/{player.get_max_hp()}"
-        )
-        self.player_hp_bar.delete("all")
-        hp_width = int((player.get_hp_percentage() / 100) * 200)
-        hp_color = "#00ff00" if player.get_hp_percentage() > 50 else "#ffaa00" if player.get_hp_percentage() > 25 else "#ff0000"
-        self.player_hp_bar.create_rectangle(0, 0, hp_width, 20, fill=hp_color)
-        
-        # Update enemy HP
-        self.enemy_hp_label.config(
-            text=f"HP: {enemy.get_current_hp()}/{enemy.get_max_hp()}"
+        self.odds_state = (game.get_player_type(), game.get_enemy_type(),
+                           player.get_current_hp(), enemy.get_current_hp(),
+                           enemy_special_chance(self.difficulty))
+        if self.odds_worker.get_cached(self.odds_state) is None:
+            self.arena_canvas.itemconfig(self.odds_text, text="Win odds: ...", fill="#777777", state="normal")
+        self.odds_worker.request(self.odds_state, self.show_win_odds)
+    
+    def show_win_odds(self, state, odds):
+        """Callback worker: tampilkan hasil jika state masih sama dengan layar"""
+        if state != self.odds_state or not self.show_odds:
+            return  # Hasil basi, state sudah berubah
+        if odds is None:
+            self.arena_canvas.itemconfig(self.odds_text, state="hidden")  # Solver gagal
+            return
+        attack, special = odds
+        self.arena_canvas.itemconfig(
+            self.odds_text,
+            text=f"Win odds - Attack {attack:.0%} | Special {special:.0%}",
+            fill="#ffdd00",
+            state="normal"
         )
-        self.enemy_hp_bar.delete("all")
-        hp_width = int((enemy.get_hp_percentage() / 100) * 200)
-        hp_color = "#00ff00" if enemy.get_hp_percentage() > 50 else "#ffaa00" if enemy.get_hp_percentage() > 25 else "#ff0000"
-        self.enemy_hp_bar.create_rectangle(0, 0, hp_width, 20, fill=hp_color)
+    
+    def toggle_odds(self):
+        """Menampilkan/menyembunyikan overlay peluang menang"""
+        self.show_odds = not self.show_odds
+        self.update_win_odds()
+    
+    def speed_label(self):
+        """Teks tombol speed animasi"""
+        speed = self.animator.get_speed()
+        return "⏩ MAX" if speed == INSTANT else f"⏩ {speed:g}x"
+    
+    def set_animation_speed(self, speed):
+        """Mengatur speed multiplier animasi (INSTANT untuk fast-forward)"""
+        self.animator.set_speed(speed)
+        self.speed_btn.config(text=self.speed_label())
+    
+    def cycle_animation_speed(self):
+        """Ganti ke speed berikutnya di ANIMATION_SPEEDS"""
+        speed = self.animator.get_speed()
+        index = ANIMATION_SPEEDS.index(speed) if speed in ANIMATION_SPEEDS else -1
+        self.set_animation_speed(ANIMATION_SPEEDS[(index + 1) % len(ANIMATION_SPEEDS)])
     
     def add_battle_log(self, message):
-        """Menambahkan pesan ke battle log"""
-        self.battle_log.config(state="normal")
-        self.battle_log.insert("end", message + "\n")
-        self.battle_log.see("end")
-        self.battle_log.config(state="disabled")
+        """Menambahkan pesan ke battle log (ditulis sekali per frame)"""
+        self.log_view.add(message)
+    
+    def add_battle_event(self, event):
+        """Menambahkan event engine ke battle log"""
+        self.log_view.add(format_event(event), self.game.get_battle_log().get_total() - 1)
+    
+    def show_older_log(self):
+        """Memuat event battle yang lebih lama ke atas battle log"""
+        self.log_view.page_older()
     
     def player_normal_attack(self):
         """Handle player normal attack dengan animasi"""
@@ -855,12 +1455,12 @@ class MonsterBattleGUI:
         self.player_visual.animate_attack()
         
         # Delay untuk sinkronisasi animasi
-        self.root.after(200, self.execute_player_attack)
+        self.animator.schedule(200, self.execute_player_attack)
     
     def execute_player_attack(self):
         """Execute player attack setelah animasi"""
-        log = self.game.player_attack(is_special=False)
-        self.add_battle_log(log)
+        event = self.game.player_attack(is_special=False)
+        self.add_battle_event(event)
         
         # Animasi enemy terkena damage
         self.enemy_visual.shake()
@@ -872,7 +1472,7 @@ class MonsterBattleGUI:
             self.end_battle(result)
             return
         
-        self.root.after(1000, self.enemy_turn)
+        self.animator.schedule(1000, self.enemy_turn)
     
     def player_special_attack(self):
         """Handle player special attack dengan animasi"""
@@ -881,12 +1481,12 @@ class MonsterBattleGUI:
         # Animasi special attack (lebih kuat)
         self.player_visual.animate_attack()
         
-        self.root.after(200, self.execute_player_special)
+        self.animator.schedule(200, self.execute_player_special)
     
     def execute_player_special(self):
         """Execute player special attack"""
-        log = self.game.player_attack(is_special=True)
-        self.add_battle_log(log)
+        event = self.game.player_attack(is_special=True)
+        self.add_battle_event(event)
         
         # Animasi enemy terkena damage
         self.enemy_visual.shake()
@@ -898,19 +1498,22 @@ class MonsterBattleGUI:
             self.end_battle(result)
             return
         
-        self.root.after(1000, self.enemy_turn)
+        self.animator.schedule(1000, self.enemy_turn)
     
     def enemy_turn(self):
         """Handle enemy turn dengan animasi"""
         # Animasi enemy attack
         self.enemy_visual.animate_attack()
         
-        self.root.after(200, self.execute_enemy_attack)
+        self.animator.schedule(200, self.execute_enemy_attack)
     
     def execute_enemy_attack(self):
         """Execute enemy attack"""
-        log = self.game.enemy_attack()
-        self.add_battle_log(log)
+        is_special = None
+        if self.replay_choices is not None:
+            is_special = bool(next(self.replay_choices, 0))
+        event = self.game.enemy_attack(is_special)
+        self.add_battle_event(event)
         
         # Animasi player terkena damage
         self.player_visual.shake()
@@ -922,6 +1525,10 @@ class MonsterBattleGUI:
             self.end_battle(result)
             return
         
+        if self.replay_choices is not None:
+            self.animator.schedule(1000, self.replay_turn)
+            return
+        
         self.enable_buttons()
     
     def disable_buttons(self):
@@ -946,20 +1553,14 @@ class MonsterBattleGUI:
         self.disable_buttons()
         
         # Show return button
-        return_btn = tk.Button(
-            self.root,
-            text="Return to Menu",
-            font=("Arial", 14, "bold"),
-            bg="#4444ff",
-            fg="white",
-            width=20,
-            height=2,
-            command=self.return_to_menu
-        )
-        return_btn.pack(pady=10)
+        self.return_btn.pack(pady=10)
     
     def return_to_menu(self):
         """Kembali ke menu utama"""
+        if self.saved_game is not None:
+            self.game = self.saved_game
+            self.saved_game = None
+            self.replay_choices = None
         self.game.reset_battle()
         self.create_menu_screen()
 
@@ -967,5 +1568,6 @@ class MonsterBattleGUI:
 # ==================== MAIN PROGRAM ====================
 if __name__ == "__main__":
     root = tk.Tk()
-    app = MonsterBattleGUI(root)
-    root.mainloop()
\ No newline at end of file
+    with StatsStore() as stats_store:
+        app = MonsterBattleGUI(root, stats_store=stats_store)
+        root.mainloop()
\ No newline at end of file
@@ -0,0 +1,471 @@
+"""
+Monster Battle Arena - Benchmark Suite
+Mengukur kecepatan hot path engine dan rendering:
+- dispatch Monster.attack()/special_attack()
+- battle penuh per detik (BattleGame)
+- siklus BattleGame.snapshot()/restore()
+- save/load biner (monster_save) dibandingkan dengan pickle
+- pembuatan item canvas MonsterVisual.draw_*
+- MonsterBattleGUI.update_battle_display()
+- transisi screen menu -> battle -> menu
+
+Rendering diukur dengan widget palsu (FakeCanvas dkk.) yang mencatat setiap
+pemanggilan, jadi tidak butuh display maupun tkinter (GUI di-import dengan
+modul tkinter palsu, lihat _load_gui). Hasil disimpan sebagai baseline JSON
+dan run berikutnya ditandai regresi jika lebih lambat dari threshold.
+
+Pemakaian:
+    python monster_benchmark.py            # jalankan dan bandingkan dengan baseline
+    python monster_benchmark.py --save     # simpan hasil sebagai baseline baru
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import timeit
+import types
+from contextlib import contextmanager
+
+from monster_engine import MONSTER_TYPES, BattleGame, get_species, play_battle
+
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.20  # 20% lebih lambat dianggap regresi
+
+
+# ==================== FAKE TK WIDGETS ====================
+class FakeWidget:
+    """Widget palsu yang menerima semua opsi tanpa menggambar apa pun"""
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = options
+        self.children = []
+        if master is not None:
+            master.children.append(self)
+
+    def pack(self, **options):
+        pass
+
+    def grid(self, **options):
+        pass
+
+    def pack_forget(self):
+        pass
+
+    def grid_forget(self):
+        pass
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def winfo_exists(self):
+        return True
+
+    def destroy(self):
+        for child in list(self.children):
+            child.destroy()
+        if self.master is not None and self in self.master.children:
+            self.master.children.remove(self)
+
+    def after(self, delay, callback=None, *args):
+        # Timer tidak dijalankan: benchmark hanya mengukur kerja sinkron
+        return "after#0"
+
+    def after_cancel(self, identifier):
+        pass
+
+    def bind(self, sequence, callback=None, add=None):
+        # Event tidak pernah dikirim: binding (mis. <Expose> preview menu) tidak jalan
+        pass
+
+    def update_idletasks(self):
+        pass
+
+
+class FakeRoot(FakeWidget):
+    """Pengganti tk.Tk"""
+    def title(self, text):
+        pass
+
+    def geometry(self, size):
+        pass
+
+    def protocol(self, name, callback=None):
+        pass
+
+
+class FakeCanvas(FakeWidget):
+    """Canvas palsu yang mencatat setiap pemanggilan (untuk menghitung biaya render)"""
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.calls = []
+        self.items = {}
+        self.__next_id = 1
+
+    def _create(self, kind, *coords, **options):
+        item = self.__next_id
+        self.__next_id += 1
+        self.items[item] = (kind, coords, options)
+        self.calls.append("create_" + kind)
+        return item
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", *coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", *coords, **options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", *coords, **options)
+
+    def create_line(self, *coords, **options):
+        return self._create("line", *coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", *coords, **options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", *coords, **options)
+
+    def move(self, tag, dx, dy):
+        self.calls.append("move")
+
+    def coords(self, tag, *coords):
+        self.calls.append("coords")
+        if not coords and tag in self.items:
+            return list(self.items[tag][1])
+        return []
+
+    def itemconfig(self, tag, **options):
+        self.calls.append("itemconfig")
+
+    itemconfigure = itemconfig
+
+    def delete(self, tag):
+        self.calls.append("delete")
+        if tag == "all":
+            self.items.clear()
+        else:
+            self.items.pop(tag, None)
+
+
+class FakeText(FakeWidget):
+    """Pengganti tk.Text"""
+    def insert(self, index, text):
+        pass
+
+    def delete(self, start, end=None):
+        pass
+
+    def see(self, index):
+        pass
+
+
+class FakePhotoImage:
+    """Pengganti tk.PhotoImage"""
+    def __init__(self, master=None, width=0, height=0, **options):
+        self.__width = width
+        self.__height = height
+
+    def put(self, data, to=None):
+        pass
+
+    def width(self):
+        return self.__width
+
+    def height(self):
+        return self.__height
+
+
+def make_fake_tk():
+    """Modul pengganti tkinter berisi widget palsu"""
+    module = types.SimpleNamespace(
+        Tk=FakeRoot, Frame=FakeWidget, Label=FakeWidget, Button=FakeWidget,
+        Canvas=FakeCanvas, Text=FakeText, PhotoImage=FakePhotoImage,
+        TclError=RuntimeError,
+    )
+    return module
+
+
+_HEADLESS_GUI = None  # monster_battle_new yang di-import dengan tkinter palsu
+
+
+def _load_gui():
+    """
+    Modul GUI untuk benchmark. Jika tkinter belum di-import (mis. lewat
+    monster_cli bench), GUI di-import dengan modul tkinter palsu lalu dilepas
+    dari sys.modules, sehingga benchmark tidak pernah memuat Tk.
+    """
+    global _HEADLESS_GUI
+    if "monster_battle_new" in sys.modules or sys.modules.get("tkinter") is not None:
+        import monster_battle_new
+        return monster_battle_new
+    if _HEADLESS_GUI is None:
+        fake = types.ModuleType("tkinter")
+        fake.__dict__.update(vars(make_fake_tk()))
+        fake.messagebox = types.ModuleType("tkinter.messagebox")
+        saved = {name: sys.modules.get(name) for name in ("tkinter", "tkinter.messagebox")}
+        sys.modules.update({"tkinter": fake, "tkinter.messagebox": fake.messagebox})
+        try:
+            import monster_battle_new
+            _HEADLESS_GUI = monster_battle_new
+        finally:
+            # Import GUI berikutnya (mis. perintah play) harus memakai tkinter asli
+            sys.modules.pop("monster_battle_new", None)
+            for name, module in saved.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+    return _HEADLESS_GUI
+
+
+@contextmanager
+def fake_tk():
+    """Menjalankan kode GUI dengan widget palsu, mengembalikan modul GUI"""
+    gui = _load_gui()
+    original = gui.tk
+    gui.tk = make_fake_tk()
+    try:
+        yield gui
+    finally:
+        gui.tk = original
+
+
+# ==================== BENCHMARKS ====================
+def measure(statement, repeat=5):
+    """Waktu terbaik per operasi (detik) memakai timeit.autorange"""
+    timer = timeit.Timer(statement)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_attack_dispatch():
+    """Satu attack() + special_attack() antar species (dengan reset HP)"""
+    attackers = [cls() for cls in MONSTER_TYPES.values()]
+    defenders = [cls() for cls in MONSTER_TYPES.values()]
+    pairs = [(a, d) for a in attackers for d in defenders]
+
+    def run():
+        for attacker, defender in pairs:
+            defender.set_current_hp(1000)
+            attacker.attack(defender)
+            attacker.special_attack(defender)
+
+    return measure(run) / len(pairs), {}
+
+
+def bench_full_battle():
+    """Satu BattleGame penuh (semua matchup bergiliran) tanpa GUI"""
+    types_ = list(MONSTER_TYPES)
+    game = BattleGame(seed=0)
+
+    def run():
+        for player_type in types_:
+            for enemy_type in types_:
+                game.reset_battle()
+                game.set_player_monster(player_type)
+                game.create_enemy_monster(enemy_type)
+                play_battle(game)
+
+    return measure(run) / (len(types_) ** 2), {}
+
+
+def bench_snapshot_restore():
+    """Satu BattleGame.snapshot() + restore() (siklus untuk AI search / what-if)"""
+    game = BattleGame(seed=0)
+    game.set_player_monster("Fire")
+    game.create_enemy_monster("Water")
+    snapshot = game.snapshot
+    restore = game.restore
+
+    def run():
+        for _ in range(100):
+            restore(snapshot())
+
+    return measure(run) / 100, {}
+
+
+def bench_save_load():
+    """monster_save encode + decode satu BattleGame (dibandingkan dengan pickle)"""
+    import pickle
+    from monster_save import decode_game, encode_game
+
+    game = BattleGame(seed=0)
+    game.set_player_monster("Water")
+    game.create_enemy_monster("Fire")
+    game.player_attack()
+    game.enemy_attack()
+
+    per_op = measure(lambda: decode_game(encode_game(game)))
+    pickle_per_op = measure(lambda: pickle.loads(pickle.dumps(game, pickle.HIGHEST_PROTOCOL)))
+    return per_op, {
+        "bytes": len(encode_game(game)),
+        "pickle_bytes": len(pickle.dumps(game, pickle.HIGHEST_PROTOCOL)),
+        "pickle_us": pickle_per_op * 1e6,
+    }
+
+
+def _bench_draw(render_mode):
+    with fake_tk() as gui:
+        canvas = FakeCanvas()
+        species = [get_species(t) for t in MONSTER_TYPES]
+
+        def run():
+            for s in species:
+                visual = gui.MonsterVisual(canvas, 75, 75, s, render_mode=render_mode)
+                visual.draw()
+                visual.clear()
+
+        try:
+            run()  # Sprite cache diisi di luar pengukuran
+            per_op = measure(run) / len(species)
+            canvas.calls.clear()
+            run()
+            calls = len(canvas.calls) / len(species)
+        finally:
+            gui.SPRITE_CACHE.clear()
+    return per_op, {"canvas_calls_per_draw": calls}
+
+
+def bench_draw():
+    """MonsterVisual.draw() (vector) untuk setiap species pada FakeCanvas"""
+    return _bench_draw("vector")
+
+
+def bench_draw_sprite():
+    """MonsterVisual.draw() dengan sprite cache yang sudah terisi"""
+    return _bench_draw("sprite")
+
+
+def _battle_gui(gui):
+    app = gui.MonsterBattleGUI(FakeRoot(), show_odds=False)
+    app.start_battle("Fire")
+    return app
+
+
+def bench_update_display():
+    """MonsterBattleGUI.update_battle_display() setelah HP pemain berubah (tanpa drain)"""
+    with fake_tk() as gui:
+        app = _battle_gui(gui)
+        player = app.game.get_player_monster()
+        hp_values = itertools.cycle((player.get_max_hp(), player.get_max_hp() - 10))
+
+        def run():
+            player.set_current_hp(next(hp_values))
+            app.update_battle_display(animate=False)
+
+        per_op = measure(run)
+        app.player_hp_bar.calls.clear()
+        run()
+        calls = len(app.player_hp_bar.calls)
+        app.player_hp_bar.calls.clear()
+        app.update_battle_display()
+        unchanged_calls = len(app.player_hp_bar.calls)
+    return per_op, {"hp_bar_calls_per_update": calls, "hp_bar_calls_unchanged": unchanged_calls}
+
+
+def bench_screen_transition():
+    """Menu -> battle -> menu (screen disimpan, hanya bagian dinamis yang di-reset)"""
+    with fake_tk() as gui:
+        app = gui.MonsterBattleGUI(FakeRoot(), show_odds=False)
+
+        def run():
+            app.start_battle("Water")
+            app.return_to_menu()
+
+        per_op = measure(run)
+    return per_op, {}
+
+
+BENCHMARKS = {
+    "attack_dispatch": bench_attack_dispatch,
+    "full_battle": bench_full_battle,
+    "snapshot_restore": bench_snapshot_restore,
+    "save_load": bench_save_load,
+    "draw_monster": bench_draw,
+    "draw_monster_sprite": bench_draw_sprite,
+    "update_battle_display": bench_update_display,
+    "screen_transition": bench_screen_transition,
+}
+
+
+def run_benchmarks(names=None):
+    """Menjalankan benchmark, mengembalikan {nama: {"seconds": ..., ...}}"""
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        seconds, extra = function()
+        results[name] = dict(seconds=seconds, ops_per_sec=1 / seconds, **extra)
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Membandingkan hasil dengan baseline.
+    Mengembalikan list (nama, ratio, regresi?) untuk benchmark yang ada di keduanya.
+    """
+    report = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["seconds"] / baseline[name]["seconds"]
+        report.append((name, ratio, ratio > 1 + threshold))
+    return report
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(path, results):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monster Battle Arena benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmark yang dijalankan (default: semua)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="file baseline JSON")
+    parser.add_argument("--save", action="store_true", help="simpan hasil sebagai baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="batas perlambatan relatif sebelum dianggap regresi")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.names)
+    for name, result in results.items():
+        extra = ", ".join(f"{k}={v:g}" for k, v in result.items() if k not in ("seconds", "ops_per_sec"))
+        print(f"{name:<24}{result['seconds'] * 1e6:>12.2f} us/op{result['ops_per_sec']:>14.0f} op/s  {extra}")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline} (run with --save to create one)")
+        return 0
+
+    regressions = 0
+    print()
+    for name, ratio, regressed in compare(results, baseline, args.threshold):
+        status = "REGRESSION" if regressed else "ok"
+        regressions += regressed
+        print(f"{name:<24}{ratio:>8.2f}x baseline  {status}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
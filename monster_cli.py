@@ -0,0 +1,169 @@
+"""
+Monster Battle Arena - Command Line
+Satu entry point untuk semua mode. Modul berat (tkinter, numpy, process pool)
+baru di-import di dalam perintah yang membutuhkannya, sehingga perintah
+headless mulai dalam puluhan milidetik.
+
+Pemakaian:
+    python monster_cli.py play [--render-mode sprite] [--no-stats] [--no-odds] [--replay FILE [--index N]]
+    python monster_cli.py simulate [--count 1000000] [--seed 0]
+    python monster_cli.py tournament [--battles 10000] [--workers 4]
+    python monster_cli.py bench [nama ...] [--save]
+Tambahkan --timings (sebelum nama perintah) untuk melihat waktu import dan frame pertama.
+"""
+
+import time
+
+_START = time.perf_counter()  # Sedini mungkin, untuk mengukur waktu start
+
+import argparse
+import sys
+
+
+def _elapsed_ms(since=_START):
+    return (time.perf_counter() - since) * 1000
+
+
+def _report(args, label, since=_START):
+    if args.timings:
+        print(f"[timing] {label}: {_elapsed_ms(since):.1f} ms", file=sys.stderr)
+
+
+# ==================== COMMANDS ====================
+def cmd_play(args):
+    """GUI tkinter (satu-satunya perintah yang meng-import tkinter)"""
+    recording = None
+    if args.replay is not None:
+        # Recording dibaca sebelum window dibuat agar file rusak gagal dengan pesan biasa
+        from monster_replay import ReplayError, load_recordings
+        try:
+            recordings = load_recordings(args.replay)
+            recording = recordings[args.index]
+        except (OSError, ReplayError) as error:
+            print(f"Cannot load replay {args.replay}: {error}", file=sys.stderr)
+            return 1
+        except IndexError:
+            print(f"Replay index {args.index} out of range ({len(recordings)} recordings)", file=sys.stderr)
+            return 1
+
+    start = time.perf_counter()
+    import monster_battle_new as gui
+    _report(args, "import monster_battle_new (tkinter)", start)
+
+    root = gui.tk.Tk()
+
+    def on_map(event):
+        # Frame pertama: window root sudah tampil di layar
+        if event.widget is root:
+            root.unbind("<Map>")
+            _report(args, "first frame")
+
+    def report_previews():
+        # Preview digambar sesudah frame pertama (binding <Expose> / prewarm sprite)
+        _report(args, "menu previews drawn")
+
+    def run(stats_store=None):
+        app = gui.MonsterBattleGUI(root, render_mode=args.render_mode, stats_store=stats_store,
+                                   show_odds=not args.no_odds)
+        app.on_previews_drawn = report_previews
+        if recording is not None:
+            app.start_replay(recording)
+        root.mainloop()
+
+    root.bind("<Map>", on_map)
+    if args.no_stats:
+        run()
+        return 0
+    with gui.StatsStore(args.stats_db) as stats_store:
+        run(stats_store)
+    return 0
+
+
+def cmd_simulate(args):
+    """Monte Carlo semua matchup dengan NumPy"""
+    start = time.perf_counter()
+    from monster_simulator import format_matrix, simulate_all
+    _report(args, "import monster_simulator (numpy)", start)
+
+    start = time.perf_counter()
+    result = simulate_all(args.count, seed=args.seed)
+    _report(args, "simulate", start)
+    print(format_matrix(result))
+    return 0
+
+
+def cmd_tournament(args):
+    """Round-robin tournament multi-proses"""
+    start = time.perf_counter()
+    from monster_tournament import format_standings, run_tournament
+    _report(args, "import monster_tournament", start)
+
+    start = time.perf_counter()
+    table = run_tournament(battles_per_matchup=args.battles, seed=args.seed, workers=args.workers)
+    _report(args, "tournament", start)
+    print(format_standings(table))
+    return 0
+
+
+def cmd_bench(args):
+    """Benchmark suite (lihat monster_benchmark); benchmark GUI memakai tkinter palsu, bukan Tk"""
+    start = time.perf_counter()
+    import monster_benchmark
+    _report(args, "import monster_benchmark", start)
+
+    argv = list(args.names)
+    if args.baseline is not None:
+        argv += ["--baseline", args.baseline]
+    if args.threshold is not None:
+        argv += ["--threshold", str(args.threshold)]
+    if args.save:
+        argv.append("--save")
+    return monster_benchmark.main(argv)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="monster_cli", description="Monster Battle Arena")
+    parser.add_argument("--timings", action="store_true", help="tampilkan waktu import/start di stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play = subparsers.add_parser("play", help="main dengan GUI tkinter")
+    play.add_argument("--render-mode", choices=("vector", "sprite"), default="vector")
+    play.add_argument("--stats-db", default="monster_stats.db", help="file SQLite untuk stats")
+    play.add_argument("--no-stats", action="store_true", help="jangan simpan stats ke database")
+    play.add_argument("--no-odds", action="store_true", help="sembunyikan overlay peluang menang")
+    play.add_argument("--replay", metavar="FILE", default=None,
+                      help="putar recording dari file buatan monster_replay.save_recordings")
+    play.add_argument("--index", type=int, default=0, help="recording yang diputar dari FILE (default 0)")
+    play.set_defaults(handler=cmd_play)
+
+    simulate = subparsers.add_parser("simulate", help="simulasi Monte Carlo semua matchup")
+    simulate.add_argument("--count", type=int, default=1_000_000, help="battle per matchup")
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.set_defaults(handler=cmd_simulate)
+
+    tournament = subparsers.add_parser("tournament", help="round-robin tournament")
+    tournament.add_argument("--battles", type=int, default=10000, help="battle per matchup")
+    tournament.add_argument("--workers", type=int, default=None, help="jumlah proses (1 = serial)")
+    tournament.add_argument("--seed", type=int, default=0)
+    tournament.set_defaults(handler=cmd_tournament)
+
+    bench = subparsers.add_parser("bench", help="jalankan benchmark suite")
+    bench.add_argument("names", nargs="*", help="benchmark yang dijalankan (default: semua)")
+    bench.add_argument("--baseline", default=None, help="file baseline JSON")
+    bench.add_argument("--save", action="store_true", help="simpan hasil sebagai baseline")
+    bench.add_argument("--threshold", type=float, default=None,
+                       help="batas perlambatan relatif sebelum dianggap regresi")
+    bench.set_defaults(handler=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    _report(args, "startup")
+    status = args.handler(args)
+    _report(args, "total")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
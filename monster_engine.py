@@ -0,0 +1,713 @@
+"""
+Monster Battle Arena - Engine (tanpa GUI)
+Berisi hierarki Monster dan BattleGame yang tidak bergantung pada tkinter,
+sehingga battle bisa dijalankan secara headless untuk simulasi dan balance check.
+
+Konsep OOP yang diimplementasikan:
+1. Encapsulation: Atribut private dan getter/setter
+2. Inheritance: Class turunan dari Monster
+3. Polymorphism: Subclass species yang dipakai lewat interface Monster yang sama
+"""
+
+import itertools
+import random
+from collections import deque, namedtuple
+
+
+# Peluang musuh memakai special attack di setiap giliran
+SPECIAL_CHANCE = 0.3
+
+
+# ==================== TYPE CHART ====================
+# Efektivitas serangan normal: (elemen penyerang, elemen target) -> multiplier
+# Kombinasi yang tidak ada di tabel dianggap netral (1.0)
+TYPE_CHART = {
+    ("Fire", "Earth"): 1.5,   # Super effective!
+    ("Fire", "Water"): 0.7,   # Not effective
+    ("Water", "Fire"): 1.5,
+    ("Water", "Earth"): 0.7,
+    ("Earth", "Water"): 1.5,
+    ("Earth", "Fire"): 0.7,
+}
+
+# Mapping nama tipe ke class monster (diisi oleh register_species)
+MONSTER_TYPES = {}
+
+# Id numerik setiap tipe sesuai urutan pendaftaran (untuk format binary)
+MONSTER_TYPE_IDS = {}
+
+# Damage yang sudah dihitung: (class penyerang, class target) -> (normal, special)
+DAMAGE_MATRIX = {}
+
+
+def get_effectiveness(attacker_element, target_element):
+    """Multiplier serangan normal berdasarkan type chart"""
+    return TYPE_CHART.get((attacker_element, target_element), 1.0)
+
+
+# ==================== SPECIES (FLYWEIGHT) ====================
+class Species(namedtuple("Species", [
+    "name", "max_hp", "attack_power", "element", "color", "visual_shape", "special_multiplier",
+])):
+    """
+    Data species yang immutable dan dipakai bersama oleh semua monster
+    dengan species yang sama (flyweight). Monster hanya menyimpan HP dan
+    referensi ke objek ini.
+    """
+    __slots__ = ()
+    
+    def get_color(self):
+        return self.color
+    
+    def get_visual_shape(self):
+        return self.visual_shape
+
+
+# Cache species agar definisi yang sama selalu memakai objek yang sama
+_SPECIES_CACHE = {}
+
+
+def make_species(name, max_hp, attack_power, element, color, visual_shape="circle", special_multiplier=1.5):
+    """Membuat (atau mengambil dari cache) objek Species yang sudah di-intern"""
+    species = Species(name, max_hp, attack_power, element, color, visual_shape, special_multiplier)
+    return _SPECIES_CACHE.setdefault(species, species)
+
+
+# ==================== ENCAPSULATION ====================
+class Monster:
+    """
+    Base class untuk semua monster
+    Mendemonstrasikan ENCAPSULATION dengan atribut private
+    Data statis (stats, elemen, warna, bentuk) ada di Species yang dipakai bersama
+    """
+    __slots__ = ("__name", "__species", "__current_hp")
+    SPECIES = None  # Species default, di-override subclass
+    
+    def __init__(self, name=None, max_hp=None, attack_power=None, element=None, color=None, species=None):
+        stats = (max_hp, attack_power, element, color)
+        if any(stat is not None for stat in stats):
+            # Signature lama Monster(name, max_hp, attack_power, element, color)
+            if species is not None or any(stat is None for stat in stats) or name is None:
+                raise TypeError("Monster stats need name, max_hp, attack_power, element and color "
+                                "(and no species)")
+            species = make_species(name, *stats)
+        elif species is None:
+            species = self.SPECIES
+            if species is None:
+                raise TypeError(f"{type(self).__name__} needs a species or "
+                                "(name, max_hp, attack_power, element, color)")
+        self.__species = species  # Private attribute (referensi ke flyweight)
+        self.__name = name if name is not None else species.name  # Private attribute
+        self.__current_hp = species.max_hp  # Private attribute
+    
+    # Getter methods (Encapsulation)
+    def get_name(self):
+        return self.__name
+    
+    def get_species(self):
+        return self.__species
+    
+    def get_max_hp(self):
+        return self.__species.max_hp
+    
+    def get_current_hp(self):
+        return self.__current_hp
+    
+    def get_attack_power(self):
+        return self.__species.attack_power
+    
+    def get_element(self):
+        return self.__species.element
+    
+    def get_color(self):
+        return self.__species.color
+    
+    # Setter methods (Encapsulation)
+    def set_current_hp(self, hp):
+        self.__current_hp = max(0, min(hp, self.__species.max_hp))
+    
+    def take_damage(self, damage):
+        """Mengurangi HP monster"""
+        self.__current_hp = max(0, self.__current_hp - damage)
+    
+    def is_alive(self):
+        """Mengecek apakah monster masih hidup"""
+        return self.__current_hp > 0
+    
+    def get_hp_percentage(self):
+        """Menghitung persentase HP untuk health bar"""
+        return (self.__current_hp / self.__species.max_hp) * 100
+    
+    def calculate_damage(self, target, is_special=False):
+        """
+        Menghitung damage ke target dari type chart tanpa mengubah HP.
+        Normal attack memakai efektivitas elemen, special attack memakai
+        special_multiplier milik species.
+        """
+        species = self.__species
+        if is_special:
+            return int(species.attack_power * species.special_multiplier)
+        return int(species.attack_power * get_effectiveness(species.element, target.get_element()))
+    
+    def attack(self, target):
+        """Serangan normal: satu lookup ke DAMAGE_MATRIX untuk species terdaftar"""
+        damages = DAMAGE_MATRIX.get((self.__class__, target.__class__))
+        damage = damages[0] if damages is not None else self.calculate_damage(target)
+        target.take_damage(damage)
+        return damage
+    
+    def special_attack(self, target):
+        """Special attack dengan damage lebih besar"""
+        damages = DAMAGE_MATRIX.get((self.__class__, target.__class__))
+        damage = damages[1] if damages is not None else self.calculate_damage(target, True)
+        target.take_damage(damage)
+        return damage
+    
+    # Method untuk mendapatkan bentuk visual monster
+    def get_visual_shape(self):
+        """Bentuk visual diambil dari species"""
+        return self.__species.visual_shape
+
+
+def register_species(monster_type):
+    """
+    Decorator untuk mendaftarkan class monster sebagai species.
+    Damage terhadap semua species lain dihitung sekali di sini, sehingga
+    attack()/special_attack() cukup melakukan satu lookup.
+    """
+    def decorator(monster_class):
+        MONSTER_TYPES[monster_type] = monster_class
+        MONSTER_TYPE_IDS.setdefault(monster_type, len(MONSTER_TYPE_IDS))
+        for other_class in MONSTER_TYPES.values():
+            attacker, defender = monster_class(), other_class()
+            DAMAGE_MATRIX[(monster_class, other_class)] = (
+                attacker.calculate_damage(defender),
+                attacker.calculate_damage(defender, True),
+            )
+            DAMAGE_MATRIX[(other_class, monster_class)] = (
+                defender.calculate_damage(attacker),
+                defender.calculate_damage(attacker, True),
+            )
+        return monster_class
+    return decorator
+
+
+# ==================== INHERITANCE & POLYMORPHISM ====================
+@register_species("Fire")
+class FireMonster(Monster):
+    """
+    Monster tipe Fire - INHERITANCE dari Monster
+    Kuat melawan Earth, lemah melawan Water (lihat TYPE_CHART)
+    Special: Fireball (2x attack power)
+    Visual: Bentuk seperti bola api dengan lidah api
+    """
+    __slots__ = ()
+    SPECIES = make_species("Flameo", max_hp=100, attack_power=25, element="Fire", color="#FF4444",
+                           visual_shape="fire", special_multiplier=2)
+    
+    def __init__(self, name="Flameo"):
+        super().__init__(name)
+
+
+@register_species("Water")
+class WaterMonster(Monster):
+    """
+    Monster tipe Water - INHERITANCE dari Monster
+    Kuat melawan Fire, lemah melawan Earth (lihat TYPE_CHART)
+    Special: Tsunami (2.2x attack power)
+    Visual: Bentuk seperti tetesan air dengan gelombang
+    """
+    __slots__ = ()
+    SPECIES = make_species("Aqualis", max_hp=120, attack_power=20, element="Water", color="#4444FF",
+                           visual_shape="water", special_multiplier=2.2)
+    
+    def __init__(self, name="Aqualis"):
+        super().__init__(name)
+
+
+@register_species("Earth")
+class EarthMonster(Monster):
+    """
+    Monster tipe Earth - INHERITANCE dari Monster
+    Kuat melawan Water, lemah melawan Fire (lihat TYPE_CHART)
+    Special: Earthquake (2.3x attack power)
+    Visual: Bentuk seperti batu dengan tekstur
+    """
+    __slots__ = ()
+    SPECIES = make_species("Terrados", max_hp=140, attack_power=18, element="Earth", color="#44FF44",
+                           visual_shape="earth", special_multiplier=2.3)
+    
+    def __init__(self, name="Terrados"):
+        super().__init__(name)
+
+
+def get_species(monster_type):
+    """Species bersama untuk nama tipe tertentu (tanpa membuat Monster)"""
+    return MONSTER_TYPES[monster_type].SPECIES
+
+
+# Nama default monster pemain untuk setiap tipe
+PLAYER_NAMES = {
+    "Fire": "Your Flameo",
+    "Water": "Your Aqualis",
+    "Earth": "Your Terrados",
+}
+
+
+# ==================== BATTLE LOG ====================
+# Event disimpan sebagai tuple biasa dengan urutan field seperti BattleEvent,
+# sehingga tidak ada pembuatan objek atau string di hot path.
+BattleEvent = namedtuple("BattleEvent", [
+    "turn", "actor", "name", "is_special", "damage", "player_hp", "enemy_hp",
+])
+
+
+def format_event(event):
+    """Membuat teks log dari satu event (hanya saat teksnya dibutuhkan)"""
+    attack_type = "SPECIAL ATTACK" if event[3] else "ATTACK"
+    return f"{event[2]} uses {attack_type}! Deals {event[4]} damage!"
+
+
+# Snapshot state battle sebagai tuple biasa dengan urutan field seperti BattleSnapshot
+BattleSnapshot = namedtuple("BattleSnapshot", [
+    "player_hp", "enemy_hp", "turn", "rng_state", "log_cursor", "choice_count",
+])
+
+# State lengkap satu battle (untuk save/load), urutan field seperti BattleState
+BattleState = namedtuple("BattleState", [
+    "player_type", "enemy_type", "player_hp", "enemy_hp", "turn", "rng_state",
+    "log_cursor", "choices", "seed", "wins", "losses",
+])
+
+
+class BattleLog:
+    """
+    Ring buffer berkapasitas tetap untuk event battle
+    Event terlama dibuang (atau ditulis ke spill stream jika ada) saat penuh
+    """
+    def __init__(self, capacity=256, spill=None, first_index=0):
+        self.__events = deque(maxlen=capacity)
+        self.__total = first_index  # Jumlah event yang pernah dicatat (log cursor)
+        self.__spill = spill  # File-like object untuk event yang terbuang
+    
+    def append(self, event):
+        """Menambahkan event, event terlama di-spill jika buffer penuh"""
+        if self.__spill is not None:
+            self.__spill_oldest()
+        self.__events.append(event)
+        self.__total += 1
+    
+    def __spill_oldest(self):
+        events = self.__events
+        if events and len(events) == events.maxlen:
+            self.__spill.write(",".join(map(str, events[0])) + "\n")
+    
+    def __len__(self):
+        return len(self.__events)
+    
+    def __iter__(self):
+        """Iterasi event di buffer sebagai BattleEvent"""
+        return map(BattleEvent._make, self.__events)
+    
+    def get_capacity(self):
+        return self.__events.maxlen
+    
+    def get_total(self):
+        """Jumlah seluruh event sejak awal battle (termasuk yang sudah terbuang)"""
+        return self.__total
+    
+    def get_first_index(self):
+        """Index global event terlama yang masih ada di buffer"""
+        return self.__total - len(self.__events)
+    
+    def recent(self, count):
+        """count event terakhir sebagai BattleEvent (paling lama di depan)"""
+        count = min(count, len(self.__events))
+        return [BattleEvent._make(e) for e in list(self.__events)[len(self.__events) - count:]]
+    
+    def events(self, start, stop=None):
+        """Event dengan index global start..stop-1 yang masih ada di buffer"""
+        first = self.get_first_index()
+        start = max(start, first) - first
+        stop = len(self.__events) if stop is None else max(0, min(stop - first, len(self.__events)))
+        return [BattleEvent._make(e) for e in itertools.islice(self.__events, start, stop)]
+    
+    def render(self, count=None):
+        """Membuat teks log untuk event di buffer (atau count event terakhir)"""
+        events = self.__events if count is None else self.recent(count)
+        return [format_event(event) for event in events]
+    
+    def truncate(self, total):
+        """
+        Membuang event dengan index global >= total (untuk restore snapshot).
+        Mengembalikan event yang dibuang (paling lama di depan); event yang
+        sudah keluar dari buffer tidak bisa dikembalikan.
+        """
+        removed = []
+        events = self.__events
+        while self.__total > total and events:
+            removed.append(events.pop())
+            self.__total -= 1
+        self.__total = min(self.__total, total)
+        removed.reverse()
+        return removed
+    
+    def clear(self):
+        self.__events.clear()
+        self.__total = 0
+
+
+# ==================== GAME CONTROLLER ====================
+class BattleGame:
+    """
+    Controller untuk mengatur logika game
+    Mendemonstrasikan composition dan encapsulation
+    """
+    def __init__(self, rng=None, log_capacity=256, log_spill=None, seed=None):
+        self.__seed = None
+        self.__rng_state = None  # getstate() terakhir, None jika RNG sudah dipakai sesudahnya
+        # Cache state RNG hanya aman untuk RNG milik game sendiri (set_seed); modul random
+        # global, rng dari pemanggil, atau RNG setelah get_rng() bisa dipakai pihak lain
+        self.__rng_cached = False
+        self.__rng = random  # Sumber angka acak
+        if rng is not None:
+            self.__rng = rng
+        elif seed is not None:
+            self.set_seed(seed)
+        self.__player_monster = None
+        self.__enemy_monster = None
+        self.__player_type = None
+        self.__enemy_type = None
+        self.__choices = bytearray()  # Pilihan setiap serangan (0 normal, 1 special)
+        self.__log_capacity = log_capacity
+        self.__log_spill = log_spill
+        self.__battle_log = BattleLog(log_capacity, log_spill)
+        self.__turn = 0
+        self.__enemy_ai = None  # Objek dengan choose(game), lihat monster_ai
+        self.__stats_store = None  # Objek dengan record_game(game, result), lihat monster_stats
+        self.__undo = []  # Stack snapshot untuk undo()
+        self.__redo = []  # Stack (snapshot, pilihan, event) untuk redo()
+        self.__wins = 0
+        self.__losses = 0
+    
+    def set_seed(self, seed=None):
+        """
+        Memakai RNG baru khusus battle ini. Jika seed None, seed dibuat
+        secara acak lalu disimpan agar battle tetap bisa direproduksi.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.__seed = seed
+        self.__rng = random.Random(seed)
+        self.__rng_state = None
+        self.__rng_cached = True  # RNG baru, belum pernah diberikan ke luar
+    
+    def get_seed(self):
+        return self.__seed
+    
+    def get_rng(self):
+        """
+        RNG game untuk dipakai langsung. Karena pemakaiannya tidak terlihat oleh
+        game, cache state RNG di snapshot() dimatikan sampai set_seed() berikutnya.
+        Untuk angka acak biasa pakai random() yang tetap memakai cache.
+        """
+        self.__rng_state = None
+        self.__rng_cached = False
+        return self.__rng
+    
+    def random(self):
+        """Angka acak [0, 1) dari RNG game (cache state RNG ikut di-reset)"""
+        self.__rng_state = None
+        return self.__rng.random()
+    
+    def set_player_monster(self, monster_type):
+        """Memilih monster pemain"""
+        if monster_type in MONSTER_TYPES:
+            self.__player_monster = MONSTER_TYPES[monster_type](PLAYER_NAMES[monster_type])
+            self.__player_type = monster_type
+    
+    def create_enemy_monster(self, monster_type=None):
+        """Membuat monster musuh secara random (atau dengan tipe tertentu)"""
+        if monster_type is None:
+            monster_type = self.__rng.choice(list(MONSTER_TYPES))
+            self.__rng_state = None
+        enemy_class = MONSTER_TYPES[monster_type]
+        self.__enemy_type = monster_type
+        self.__enemy_monster = enemy_class("Enemy " + enemy_class.__name__.replace("Monster", ""))
+    
+    def get_player_monster(self):
+        return self.__player_monster
+    
+    def get_enemy_monster(self):
+        return self.__enemy_monster
+    
+    def get_player_type(self):
+        return self.__player_type
+    
+    def get_enemy_type(self):
+        return self.__enemy_type
+    
+    def get_choices(self):
+        """Semua pilihan serangan battle ini secara berurutan (untuk replay)"""
+        return bytes(self.__choices)
+    
+    def set_enemy_ai(self, ai):
+        """Memasang AI musuh (None = pilihan acak dengan SPECIAL_CHANCE)"""
+        self.__enemy_ai = ai
+    
+    def get_enemy_ai(self):
+        return self.__enemy_ai
+    
+    def set_stats_store(self, store):
+        """Memasang penyimpan history battle (None = hanya counter di memori)"""
+        self.__stats_store = store
+    
+    def get_stats_store(self):
+        return self.__stats_store
+    
+    def get_battle_log(self):
+        return self.__battle_log
+    
+    def get_turn(self):
+        return self.__turn
+    
+    def player_attack(self, is_special=False):
+        """Pemain menyerang musuh, mengembalikan event (urutan field BattleEvent)"""
+        player = self.__player_monster
+        enemy = self.__enemy_monster
+        if is_special:
+            damage = player.special_attack(enemy)
+        else:
+            damage = player.attack(enemy)
+        
+        self.__turn += 1
+        self.__choices.append(is_special)
+        event = (self.__turn, "player", player.get_name(), is_special, damage,
+                 player.get_current_hp(), enemy.get_current_hp())
+        self.__battle_log.append(event)
+        return event
+    
+    def enemy_attack(self, is_special=None):
+        """
+        Musuh menyerang pemain, mengembalikan event (urutan field BattleEvent)
+        is_special diisi saat replay, selain itu dipilih oleh AI musuh
+        atau secara random
+        """
+        if is_special is None and self.__enemy_ai is not None:
+            is_special = self.__enemy_ai.choose(self)
+        if is_special is None:
+            is_special = self.__rng.random() < SPECIAL_CHANCE
+            self.__rng_state = None
+        self.__choices.append(is_special)
+        player = self.__player_monster
+        enemy = self.__enemy_monster
+        
+        if is_special:
+            damage = enemy.special_attack(player)
+        else:
+            damage = enemy.attack(player)
+        
+        event = (self.__turn, "enemy", enemy.get_name(), is_special, damage,
+                 player.get_current_hp(), enemy.get_current_hp())
+        self.__battle_log.append(event)
+        return event
+    
+    def check_battle_end(self):
+        """Mengecek apakah battle sudah selesai"""
+        if not self.__player_monster.is_alive():
+            self.__losses += 1
+            result = "lose"
+        elif not self.__enemy_monster.is_alive():
+            self.__wins += 1
+            result = "win"
+        else:
+            return None
+        if self.__stats_store is not None:
+            self.__stats_store.record_game(self, result)
+        return result
+    
+    def get_stats(self):
+        """Mendapatkan statistik win/lose"""
+        return self.__wins, self.__losses
+    
+    # ==================== SNAPSHOT / UNDO ====================
+    def snapshot(self):
+        """
+        State battle saat ini sebagai tuple immutable (urutan field BattleSnapshot).
+        State RNG hanya diambil ulang jika RNG sudah dipakai sejak snapshot terakhir.
+        """
+        rng_state = self.__rng_state
+        if rng_state is None or not self.__rng_cached:
+            rng_state = self.__rng_state = self.__rng.getstate()
+        return (self.__player_monster.get_current_hp(), self.__enemy_monster.get_current_hp(),
+                self.__turn, rng_state, self.__battle_log.get_total(), len(self.__choices))
+    
+    def restore(self, snapshot):
+        """
+        Mengembalikan state dari snapshot() battle yang sama.
+        Pilihan dan event log sesudah snapshot dibuang.
+        """
+        player_hp, enemy_hp, turn, rng_state, log_cursor, choice_count = snapshot
+        self.__player_monster.set_current_hp(player_hp)
+        self.__enemy_monster.set_current_hp(enemy_hp)
+        self.__turn = turn
+        if rng_state is not self.__rng_state or not self.__rng_cached:
+            self.__rng.setstate(rng_state)
+            self.__rng_state = rng_state
+        if self.__battle_log.get_total() != log_cursor:
+            self.__battle_log.truncate(log_cursor)
+        if len(self.__choices) != choice_count:
+            del self.__choices[choice_count:]
+    
+    def checkpoint(self):
+        """Menyimpan state saat ini ke stack undo (redo dikosongkan)"""
+        self.__undo.append(self.snapshot())
+        self.__redo.clear()
+    
+    def undo(self):
+        """Kembali ke checkpoint terakhir, mengembalikan False jika stack kosong"""
+        if not self.__undo:
+            return False
+        current = self.snapshot()
+        choice_count = current[5]
+        target = self.__undo.pop()
+        choices = bytes(self.__choices[target[5]:choice_count])
+        events = self.__battle_log.truncate(target[4])
+        self.restore(target)
+        self.__redo.append((current, choices, events))
+        return True
+    
+    def redo(self):
+        """Mengulang state yang dibatalkan undo(), mengembalikan False jika stack kosong"""
+        if not self.__redo:
+            return False
+        target, choices, events = self.__redo.pop()
+        self.__undo.append(self.snapshot())
+        self.__choices += choices
+        for event in events:
+            self.__battle_log.append(event)
+        self.restore(target)
+        return True
+    
+    def can_undo(self):
+        return bool(self.__undo)
+    
+    def can_redo(self):
+        return bool(self.__redo)
+    
+    def export_state(self):
+        """State lengkap battle sebagai tuple (urutan field BattleState)"""
+        return (self.__player_type, self.__enemy_type,
+                self.__player_monster.get_current_hp(), self.__enemy_monster.get_current_hp(),
+                self.__turn, self.snapshot()[3], self.__battle_log.get_total(),
+                bytes(self.__choices), self.__seed, self.__wins, self.__losses)
+    
+    def import_state(self, state):
+        """
+        Memuat state dari export_state(). Isi log tidak ikut disimpan:
+        log dimulai kosong dengan cursor yang sama.
+        """
+        (player_type, enemy_type, player_hp, enemy_hp, turn, rng_state,
+         log_cursor, choices, seed, wins, losses) = state
+        self.reset_battle()
+        self.set_player_monster(player_type)
+        self.create_enemy_monster(enemy_type)
+        self.__player_monster.set_current_hp(player_hp)
+        self.__enemy_monster.set_current_hp(enemy_hp)
+        self.__turn = turn
+        self.__seed = seed
+        if not isinstance(self.__rng, random.Random):
+            # Tanpa seeding (mahal): state langsung diisi oleh setstate di bawah
+            self.__rng = random.Random.__new__(random.Random)
+            self.__rng_cached = True
+        self.__rng.setstate(rng_state)
+        self.__rng_state = rng_state
+        self.__battle_log = BattleLog(self.__log_capacity, self.__log_spill, log_cursor)
+        self.__choices = bytearray(choices)
+        self.__wins = wins
+        self.__losses = losses
+    
+    def reset_battle(self):
+        """Reset battle untuk pertarungan baru"""
+        self.__player_monster = None
+        self.__enemy_monster = None
+        self.__player_type = None
+        self.__enemy_type = None
+        self.__choices = bytearray()
+        self.__battle_log = BattleLog(self.__log_capacity, self.__log_spill)
+        self.__turn = 0
+        self.__undo.clear()
+        self.__redo.clear()
+
+
+def build_damage_table():
+    """
+    Damage setiap kombinasi (attacker, defender, jenis serangan) per nama tipe,
+    diambil dari DAMAGE_MATRIX sehingga simulator dan solver selalu
+    konsisten dengan engine.
+    Mengembalikan dict {(attacker_type, defender_type): (normal, special)}.
+    """
+    return {
+        (attacker_type, defender_type): DAMAGE_MATRIX[(attacker_class, defender_class)]
+        for attacker_type, attacker_class in MONSTER_TYPES.items()
+        for defender_type, defender_class in MONSTER_TYPES.items()
+    }
+
+
+# ==================== HEADLESS RUNNER ====================
+BattleResult = namedtuple("BattleResult", ["result", "turns", "player_hp", "enemy_hp"])
+
+
+def play_battle(game, player_special_chance=SPECIAL_CHANCE):
+    """
+    Memainkan BattleGame yang monsternya sudah dipilih sampai selesai.
+    Pemain memilih special attack dengan peluang player_special_chance,
+    musuh memakai aturan yang sama seperti di BattleGame.enemy_attack().
+    Mengembalikan BattleResult (result, turns, player_hp, enemy_hp).
+    """
+    player = game.get_player_monster()
+    enemy = game.get_enemy_monster()
+    player_attack = game.player_attack
+    enemy_attack = game.enemy_attack
+    check_battle_end = game.check_battle_end
+    chance = game.random
+
+    turns = 0
+    result = None
+    while result is None:
+        turns += 1
+        player_attack(chance() < player_special_chance)
+        result = check_battle_end()
+        if result is None:
+            enemy_attack()
+            result = check_battle_end()
+
+    return BattleResult(result, turns, player.get_current_hp(), enemy.get_current_hp())
+
+
+def run_battle(player_type, enemy_type, seed=None, player_special_chance=SPECIAL_CHANCE, rng=None):
+    """
+    Menjalankan satu battle penuh tanpa GUI dan tanpa delay animasi.
+    Jika rng diberikan, seed diabaikan (berguna untuk loop simulasi);
+    jika seed None, dipakai seed acak.
+    Mengembalikan BattleResult (result, turns, player_hp, enemy_hp).
+    """
+    game = BattleGame(rng)
+    if rng is None:
+        game.set_seed(seed)
+    game.set_player_monster(player_type)
+    game.create_enemy_monster(enemy_type)
+    return play_battle(game, player_special_chance)
+
+
+def run_battles(player_type, enemy_type, count, seed=None, player_special_chance=SPECIAL_CHANCE):
+    """
+    Menjalankan banyak battle berturut-turut dengan satu RNG bersama.
+    Seeding RNG hanya dilakukan sekali, jadi jauh lebih cepat daripada
+    memanggil run_battle() dengan seed berbeda untuk setiap battle.
+    """
+    rng = random.Random(seed)
+    return [
+        run_battle(player_type, enemy_type, player_special_chance=player_special_chance, rng=rng)
+        for _ in range(count)
+    ]
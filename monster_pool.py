@@ -0,0 +1,184 @@
+"""
+Monster Battle Arena - Monster Pool (struct-of-arrays)
+Menyimpan jutaan monster sebagai array NumPy bertipe (species id, HP saat ini,
+HP maksimum, attack power) alih-alih satu objek Monster per monster.
+MonsterView adalah objek ringan (__slots__) yang memberi API yang sama dengan
+Monster (get_current_hp, take_damage, is_alive, ...) untuk satu baris pool.
+
+Membutuhkan numpy (pip install numpy).
+"""
+
+import numpy as np
+
+from monster_engine import DAMAGE_MATRIX, MONSTER_TYPES, Monster, get_species
+
+
+# Species id mengikuti urutan pendaftaran di MONSTER_TYPES
+SPECIES_TYPES = list(MONSTER_TYPES)
+SPECIES_IDS = {monster_type: index for index, monster_type in enumerate(SPECIES_TYPES)}
+
+# Species bersama (flyweight) untuk data yang tidak berubah (nama, elemen, warna, bentuk)
+_SPECIES = [get_species(monster_type) for monster_type in SPECIES_TYPES]
+
+# Damage per (species penyerang, species target, jenis serangan: 0 normal / 1 special)
+SPECIES_DAMAGE = np.zeros((len(SPECIES_TYPES), len(SPECIES_TYPES), 2), dtype=np.int32)
+for _a, _attacker in enumerate(SPECIES_TYPES):
+    for _d, _defender in enumerate(SPECIES_TYPES):
+        SPECIES_DAMAGE[_a, _d] = DAMAGE_MATRIX[(MONSTER_TYPES[_attacker], MONSTER_TYPES[_defender])]
+
+
+class MonsterView:
+    """
+    View ringan ke satu monster di dalam MonsterPool
+    API sama dengan Monster sehingga bisa dipakai di kode yang sudah ada
+    """
+    __slots__ = ("_pool", "_index")
+
+    def __init__(self, pool, index):
+        self._pool = pool
+        self._index = index
+
+    def get_species(self):
+        return _SPECIES[self._pool.species[self._index]]
+
+    # Getter methods
+    def get_name(self):
+        return self.get_species().name
+
+    def get_max_hp(self):
+        return int(self._pool.max_hp[self._index])
+
+    def get_current_hp(self):
+        return int(self._pool.current_hp[self._index])
+
+    def get_attack_power(self):
+        return int(self._pool.attack_power[self._index])
+
+    def get_element(self):
+        return self.get_species().element
+
+    def get_color(self):
+        return self.get_species().color
+
+    def get_visual_shape(self):
+        return self.get_species().visual_shape
+
+    def get_species_id(self):
+        return int(self._pool.species[self._index])
+
+    # Setter methods
+    def set_current_hp(self, hp):
+        self._pool.current_hp[self._index] = max(0, min(hp, self.get_max_hp()))
+
+    def take_damage(self, damage):
+        """Mengurangi HP monster"""
+        self._pool.current_hp[self._index] = max(0, self.get_current_hp() - damage)
+
+    def is_alive(self):
+        """Mengecek apakah monster masih hidup"""
+        return self._pool.current_hp[self._index] > 0
+
+    def get_hp_percentage(self):
+        """Menghitung persentase HP untuk health bar"""
+        return (self.get_current_hp() / self.get_max_hp()) * 100
+
+    def calculate_damage(self, target, is_special=False):
+        """Damage ke target: lookup SPECIES_DAMAGE jika target juga view pool"""
+        if isinstance(target, MonsterView):
+            return int(SPECIES_DAMAGE[self.get_species_id(), target.get_species_id(), int(is_special)])
+        return Monster(species=self.get_species()).calculate_damage(target, is_special)
+
+    def attack(self, target):
+        damage = self.calculate_damage(target)
+        target.take_damage(damage)
+        return damage
+
+    def special_attack(self, target):
+        damage = self.calculate_damage(target, True)
+        target.take_damage(damage)
+        return damage
+
+
+class MonsterPool:
+    """
+    Kumpulan monster dalam bentuk struct-of-arrays
+    Setiap kolom adalah array NumPy bertipe, baris ke-i adalah monster ke-i
+    """
+    def __init__(self, capacity=1024):
+        capacity = max(1, capacity)
+        self.__size = 0
+        self.species = np.zeros(capacity, dtype=np.int8)
+        self.current_hp = np.zeros(capacity, dtype=np.int32)
+        self.max_hp = np.zeros(capacity, dtype=np.int32)
+        self.attack_power = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return self.__size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.__size:
+            raise IndexError("MonsterPool index out of range")
+        return MonsterView(self, index)
+
+    def _grow(self, needed):
+        """Memperbesar kapasitas array (kelipatan dua) jika perlu"""
+        capacity = len(self.species)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for column in ("species", "current_hp", "max_hp", "attack_power"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.__size] = old[:self.__size]
+            setattr(self, column, new)
+
+    def add(self, monster_type, count=1):
+        """Menambah count monster baru dengan HP penuh, mengembalikan index pertama"""
+        species = _SPECIES[SPECIES_IDS[monster_type]]
+        start = self.__size
+        end = start + count
+        self._grow(end)
+        self.species[start:end] = SPECIES_IDS[monster_type]
+        self.current_hp[start:end] = species.max_hp
+        self.max_hp[start:end] = species.max_hp
+        self.attack_power[start:end] = species.attack_power
+        self.__size = end
+        return start
+
+    def take_damage(self, indices, damage):
+        """
+        Bulk take_damage: mengurangi HP banyak monster sekaligus.
+        indices boleh berisi index yang sama lebih dari sekali.
+        """
+        hp = self.current_hp[:self.__size]
+        np.subtract.at(hp, indices, damage)
+        np.maximum(hp, 0, out=hp)
+
+    def attack(self, attackers, targets, is_special=False):
+        """
+        Bulk attack: attackers[i] menyerang targets[i] memakai damage matrix.
+        is_special boleh berupa bool atau array bool. Mengembalikan array damage.
+        """
+        attackers = np.asarray(attackers)
+        targets = np.asarray(targets)
+        kind = np.asarray(is_special, dtype=np.intp)
+        damage = SPECIES_DAMAGE[self.species[attackers], self.species[targets], kind]
+        self.take_damage(targets, damage)
+        return damage
+
+    def alive_mask(self):
+        """Array bool: True untuk monster yang masih hidup"""
+        return self.current_hp[:self.__size] > 0
+
+    def hp_percentage(self):
+        """Persentase HP semua monster"""
+        return self.current_hp[:self.__size] / self.max_hp[:self.__size] * 100
+
+    def heal_all(self):
+        """Mengembalikan HP semua monster ke maksimum"""
+        self.current_hp[:self.__size] = self.max_hp[:self.__size]
+
+    def bytes_per_monster(self):
+        """Pemakaian memori array per monster (tanpa overhead objek pool)"""
+        return sum(getattr(self, c).itemsize for c in ("species", "current_hp", "max_hp", "attack_power"))
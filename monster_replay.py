@@ -0,0 +1,189 @@
+"""
+Monster Battle Arena - Recording & Replay
+Menyimpan setiap pilihan serangan dalam format binary yang ringkas
+(1 bit per serangan) dan memutar ulang battle lewat BattleGame, baik secara
+headless dengan kecepatan penuh maupun lewat MonsterBattleGUI dengan animasi.
+
+Format satu recording (little endian):
+    magic "MBRP" | version (B) | flags (B) | player type id (B) | enemy type id (B)
+    | jumlah serangan (I) | seed (Q, hanya jika flag HAS_SEED) | bit pilihan
+"""
+
+import random
+import struct
+from collections import namedtuple
+
+from monster_engine import MONSTER_TYPE_IDS, SPECIAL_CHANCE, BattleGame, BattleResult, play_battle
+
+
+MAGIC = b"MBRP"
+VERSION = 1
+FLAG_HAS_SEED = 0x01
+
+_HEADER = struct.Struct("<4sBBBBI")
+_SEED = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+
+Recording = namedtuple("Recording", ["player_type", "enemy_type", "seed", "choices"])
+
+
+class ReplayError(Exception):
+    """Recording tidak valid atau tidak cocok dengan engine"""
+
+
+def _type_name(type_id):
+    for monster_type, known_id in MONSTER_TYPE_IDS.items():
+        if known_id == type_id:
+            return monster_type
+    raise ReplayError(f"Unknown monster type id: {type_id}")
+
+
+def recording_from_game(game):
+    """Membuat Recording dari BattleGame yang sudah (atau sedang) berjalan"""
+    return Recording(game.get_player_type(), game.get_enemy_type(), game.get_seed(), game.get_choices())
+
+
+def encode_recording(recording):
+    """Mengubah Recording menjadi bytes"""
+    seed = recording.seed
+    has_seed = isinstance(seed, int) and 0 <= seed < 2 ** 64
+    flags = FLAG_HAS_SEED if has_seed else 0
+
+    packed = bytearray((len(recording.choices) + 7) // 8)
+    for index, choice in enumerate(recording.choices):
+        if choice:
+            packed[index >> 3] |= 1 << (index & 7)
+
+    data = _HEADER.pack(
+        MAGIC, VERSION, flags,
+        MONSTER_TYPE_IDS[recording.player_type], MONSTER_TYPE_IDS[recording.enemy_type],
+        len(recording.choices),
+    )
+    if has_seed:
+        data += _SEED.pack(seed)
+    return data + bytes(packed)
+
+
+def decode_recording(data, offset=0):
+    """
+    Membaca satu Recording dari bytes mulai dari offset.
+    Mengembalikan tuple (recording, offset setelah recording).
+    """
+    if offset < 0 or len(data) - offset < _HEADER.size:
+        raise ReplayError("Truncated recording header")
+    magic, version, flags, player_id, enemy_id, count = _HEADER.unpack_from(data, offset)
+    if magic != MAGIC:
+        raise ReplayError("Not a battle recording")
+    if version != VERSION:
+        raise ReplayError(f"Unsupported recording version: {version}")
+    offset += _HEADER.size
+
+    seed = None
+    if flags & FLAG_HAS_SEED:
+        if len(data) - offset < _SEED.size:
+            raise ReplayError("Truncated recording seed")
+        (seed,) = _SEED.unpack_from(data, offset)
+        offset += _SEED.size
+
+    size = (count + 7) // 8
+    packed = data[offset:offset + size]
+    if len(packed) != size:
+        raise ReplayError("Truncated recording choices")
+    choices = bytes((packed[i >> 3] >> (i & 7)) & 1 for i in range(count))
+    recording = Recording(_type_name(player_id), _type_name(enemy_id), seed, choices)
+    return recording, offset + size
+
+
+def replay_battle(recording):
+    """
+    Memutar ulang recording secara headless secepat mungkin lewat BattleGame.
+    Mengembalikan BattleResult; ReplayError jika recording tidak cocok.
+    """
+    game = BattleGame()  # Tidak perlu RNG: semua pilihan ada di recording
+    game.set_player_monster(recording.player_type)
+    game.create_enemy_monster(recording.enemy_type)
+    player_attack = game.player_attack
+    enemy_attack = game.enemy_attack
+    check_battle_end = game.check_battle_end
+
+    choices = recording.choices
+    result = None
+    index = 0
+    while result is None and index < len(choices):
+        if index % 2 == 0:
+            player_attack(bool(choices[index]))
+        else:
+            enemy_attack(bool(choices[index]))
+        index += 1
+        result = check_battle_end()
+
+    if result is None or index != len(choices):
+        raise ReplayError("Recording does not match battle outcome")
+    player = game.get_player_monster()
+    enemy = game.get_enemy_monster()
+    return BattleResult(result, game.get_turn(), player.get_current_hp(), enemy.get_current_hp())
+
+
+def record_battle(player_type, enemy_type, seed=None, player_special_chance=SPECIAL_CHANCE):
+    """
+    Memainkan satu battle headless (seperti run_battle()) dan mengembalikan
+    tuple (BattleResult, Recording).
+    """
+    game = BattleGame()
+    game.set_seed(seed)
+    game.set_player_monster(player_type)
+    game.create_enemy_monster(enemy_type)
+    return play_battle(game, player_special_chance), recording_from_game(game)
+
+
+def save_recordings(path, recordings):
+    """Menyimpan banyak recording ke satu file (setiap record diberi prefix panjang)"""
+    with open(path, "wb") as file:
+        for recording in recordings:
+            data = encode_recording(recording)
+            file.write(_LENGTH.pack(len(data)))
+            file.write(data)
+
+
+def load_recordings(path):
+    """Membaca semua recording dari file buatan save_recordings()"""
+    with open(path, "rb") as file:
+        data = memoryview(file.read())
+    recordings = []
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _LENGTH.size:
+            raise ReplayError("Truncated recording length")
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        if len(data) - offset < length:
+            raise ReplayError("Truncated recording")
+        # Recording dibaca hanya dari bagian miliknya, tidak melewati ke record berikutnya
+        recording, end = decode_recording(data[:offset + length], offset)
+        if end != offset + length:
+            raise ReplayError("Recording length mismatch")
+        recordings.append(recording)
+        offset = end
+    return recordings
+
+
+def replay_file(path):
+    """Memutar ulang semua recording di file, mengembalikan list BattleResult"""
+    return [replay_battle(recording) for recording in load_recordings(path)]
+
+
+def make_fixtures(path, count, seed=0):
+    """
+    Membuat file fixture regresi berisi count battle acak (semua matchup)
+    dan mengembalikan hasil yang diharapkan.
+    """
+    rng = random.Random(seed)
+    types = list(MONSTER_TYPE_IDS)
+    recordings = []
+    results = []
+    for _ in range(count):
+        result, recording = record_battle(rng.choice(types), rng.choice(types), seed=rng.getrandbits(64))
+        recordings.append(recording)
+        results.append(result)
+    save_recordings(path, recordings)
+    return results
@@ -0,0 +1,189 @@
+"""
+Monster Battle Arena - Save/Load Battle (binary)
+Format biner versi tetap untuk satu BattleGame lengkap, dibuat dengan struct
+sehingga jauh lebih kecil dan cepat daripada pickle. Cocok untuk save/resume
+di GUI maupun checkpoint ribuan sesi di server.
+
+Format satu battle (little endian):
+    magic "MBSV" | version (B) | flags (B) | player type id (B) | enemy type id (B)
+    | player HP (H) | enemy HP (H) | turn (I) | log cursor (I) | wins (I) | losses (I)
+    | jumlah pilihan (I) | seed (Q, jika FLAG_HAS_SEED)
+    | state Mersenne Twister (625 x I) | gauss_next (d, jika FLAG_HAS_GAUSS)
+    | bit pilihan
+Isi battle log tidak disimpan, hanya cursor-nya (lihat BattleGame.import_state).
+"""
+
+import struct
+
+from monster_engine import MONSTER_TYPE_IDS, BattleGame
+
+
+MAGIC = b"MBSV"
+VERSION = 1
+FLAG_HAS_SEED = 0x01
+FLAG_HAS_GAUSS = 0x02
+
+_HEADER = struct.Struct("<4sBBBBHHIIIII")
+_SEED = struct.Struct("<Q")
+_RNG = struct.Struct("<625I")
+_GAUSS = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+
+_TYPE_NAMES = {type_id: monster_type for monster_type, type_id in MONSTER_TYPE_IDS.items()}
+
+# Tabel bit: byte -> 8 pilihan (0/1), untuk decode tanpa loop per bit
+_UNPACKED_BITS = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
+class SaveError(Exception):
+    """Data save tidak valid"""
+
+
+def _pack_choices(choices):
+    packed = bytearray((len(choices) + 7) // 8)
+    for index, choice in enumerate(choices):
+        if choice:
+            packed[index >> 3] |= 1 << (index & 7)
+    return bytes(packed)
+
+
+def _unpack_choices(packed, count):
+    return b"".join([_UNPACKED_BITS[value] for value in packed])[:count]
+
+
+def encode_state(state):
+    """Mengubah tuple BattleState (BattleGame.export_state) menjadi bytes"""
+    (player_type, enemy_type, player_hp, enemy_hp, turn, rng_state,
+     log_cursor, choices, seed, wins, losses) = state
+    version, internal_state, gauss_next = rng_state
+    if version != 3:
+        raise SaveError(f"Unsupported RNG state version: {version}")
+
+    flags = 0
+    has_seed = seed is not None
+    if has_seed and not (isinstance(seed, int) and 0 <= seed < 2 ** 64):
+        # random.Random menerima seed str/bytes/int besar, tapi format ini hanya menyimpan Q
+        raise SaveError(f"Unsupported seed {seed!r}: only integers in [0, 2**64) can be saved")
+    if has_seed:
+        flags |= FLAG_HAS_SEED
+    if gauss_next is not None:
+        flags |= FLAG_HAS_GAUSS
+
+    parts = [_HEADER.pack(
+        MAGIC, VERSION, flags, MONSTER_TYPE_IDS[player_type], MONSTER_TYPE_IDS[enemy_type],
+        player_hp, enemy_hp, turn, log_cursor, wins, losses, len(choices),
+    )]
+    if has_seed:
+        parts.append(_SEED.pack(seed))
+    parts.append(_RNG.pack(*internal_state))
+    if gauss_next is not None:
+        parts.append(_GAUSS.pack(gauss_next))
+    parts.append(_pack_choices(choices))
+    return b"".join(parts)
+
+
+def decode_state(data, offset=0):
+    """
+    Membaca satu BattleState dari bytes mulai dari offset.
+    Mengembalikan tuple (state, offset setelah battle).
+    """
+    try:
+        (magic, version, flags, player_id, enemy_id, player_hp, enemy_hp, turn,
+         log_cursor, wins, losses, count) = _HEADER.unpack_from(data, offset)
+        if magic != MAGIC:
+            raise SaveError("Not a battle save")
+        if version != VERSION:
+            raise SaveError(f"Unsupported save version: {version}")
+        offset += _HEADER.size
+
+        seed = None
+        if flags & FLAG_HAS_SEED:
+            (seed,) = _SEED.unpack_from(data, offset)
+            offset += _SEED.size
+        internal_state = _RNG.unpack_from(data, offset)
+        offset += _RNG.size
+        gauss_next = None
+        if flags & FLAG_HAS_GAUSS:
+            (gauss_next,) = _GAUSS.unpack_from(data, offset)
+            offset += _GAUSS.size
+    except struct.error as error:
+        raise SaveError("Truncated battle save") from error
+
+    size = (count + 7) // 8
+    packed = data[offset:offset + size]
+    if len(packed) != size:
+        raise SaveError("Truncated battle choices")
+    try:
+        player_type = _TYPE_NAMES[player_id]
+        enemy_type = _TYPE_NAMES[enemy_id]
+    except KeyError as error:
+        raise SaveError(f"Unknown monster type id: {error.args[0]}") from None
+
+    state = (player_type, enemy_type, player_hp, enemy_hp, turn, (3, internal_state, gauss_next),
+             log_cursor, _unpack_choices(packed, count), seed, wins, losses)
+    return state, offset + size
+
+
+def encode_game(game):
+    """Mengubah BattleGame menjadi bytes"""
+    if game.get_player_monster() is None or game.get_enemy_monster() is None:
+        raise SaveError("No battle to save (monsters not created yet)")
+    return encode_state(game.export_state())
+
+
+def decode_game(data, offset=0, game=None):
+    """
+    Membuat BattleGame dari bytes (atau memuat ke game yang sudah ada).
+    Mengembalikan tuple (game, offset setelah battle).
+    """
+    state, offset = decode_state(data, offset)
+    if game is None:
+        game = BattleGame()
+    try:
+        game.import_state(state)
+    except ValueError as error:
+        raise SaveError(f"Invalid battle state: {error}") from error
+    return game, offset
+
+
+def encode_games(games):
+    """Bulk encode: banyak BattleGame menjadi satu blok bytes (setiap battle diberi prefix panjang)"""
+    parts = []
+    for game in games:
+        data = encode_game(game)
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def decode_games(data):
+    """Bulk decode hasil encode_games(), mengembalikan list BattleGame"""
+    data = memoryview(data)
+    games = []
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _LENGTH.size:
+            raise SaveError("Truncated battle length")
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        if len(data) - offset < length:
+            raise SaveError("Truncated battle")
+        game, end = decode_game(data[:offset + length], offset)
+        if end != offset + length:
+            raise SaveError("Battle length mismatch")
+        games.append(game)
+        offset = end
+    return games
+
+
+def save(path, game):
+    """Menyimpan satu BattleGame ke file"""
+    with open(path, "wb") as file:
+        file.write(encode_game(game))
+
+
+def load(path):
+    """Memuat BattleGame dari file buatan save()"""
+    with open(path, "rb") as file:
+        game, _ = decode_game(file.read())
+    return game
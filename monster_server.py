@@ -0,0 +1,323 @@
+"""
+Monster Battle Arena - Battle Server (asyncio)
+Server TCP yang menampung banyak sesi BattleGame sekaligus: satu koneksi
+adalah satu sesi pemain dengan BattleGame sendiri. Tersedia juga load
+generator untuk mengukur latency per turn dan jumlah sesi per detik.
+
+Protokol teks satu baris per perintah (ASCII, diakhiri "\\n"):
+    START <player_type> [enemy_type]  -> READY <enemy_type> <player_hp> <enemy_hp>
+    A | S                             -> TURN <turn> <damage> <enemy_special> <enemy_damage>
+                                              <player_hp> <enemy_hp> <result|->
+    STATS                             -> STATS <wins> <losses>
+    QUIT                              -> BYE
+Perintah tidak valid dijawab "ERR <pesan>". Sesi yang diam lebih dari
+idle_timeout detik ditutup dengan "BYE idle"; jika server penuh koneksi baru
+langsung mendapat "ERR busy".
+
+Pemakaian:
+    python monster_server.py serve --port 8765
+    python monster_server.py load --port 8765 --sessions 1000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import namedtuple
+
+from monster_engine import MONSTER_TYPES, SPECIAL_CHANCE, BattleGame
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT = 60.0  # Detik tanpa perintah sebelum sesi ditutup
+MAX_SESSIONS = 10000
+MAX_LINE = 256  # Batas panjang satu perintah (byte)
+
+LoadReport = namedtuple("LoadReport", [
+    "sessions", "battles", "turns", "seconds", "p50_ms", "p99_ms", "sessions_per_sec",
+])
+
+
+class ProtocolError(Exception):
+    """Perintah client tidak valid"""
+
+
+# ==================== SERVER ====================
+class BattleSession:
+    """Satu sesi pemain: BattleGame sendiri dan status battle"""
+    __slots__ = ("game", "in_battle")
+
+    def __init__(self, seed=None):
+        self.game = BattleGame(seed=seed)
+        self.in_battle = False
+
+    def handle(self, line):
+        """Menjalankan satu perintah, mengembalikan baris balasan (tanpa newline)"""
+        parts = line.split()
+        if not parts:
+            raise ProtocolError("empty command")
+        command = parts[0].upper()
+        game = self.game
+
+        if command in ("A", "S"):
+            if not self.in_battle:
+                raise ProtocolError("no battle, send START first")
+            event = game.player_attack(command == "S")
+            result = game.check_battle_end()
+            enemy_special = enemy_damage = 0
+            if result is None:
+                enemy_event = game.enemy_attack()
+                enemy_special, enemy_damage = int(enemy_event[3]), enemy_event[4]
+                result = game.check_battle_end()
+            if result is not None:
+                self.in_battle = False
+            player = game.get_player_monster()
+            enemy = game.get_enemy_monster()
+            return (f"TURN {event[0]} {event[4]} {enemy_special} {enemy_damage} "
+                    f"{player.get_current_hp()} {enemy.get_current_hp()} {result or '-'}")
+
+        if command == "START":
+            if len(parts) not in (2, 3):
+                raise ProtocolError("usage: START <player_type> [enemy_type]")
+            player_type = parts[1].title()
+            enemy_type = parts[2].title() if len(parts) == 3 else None
+            for monster_type in (player_type, enemy_type):
+                if monster_type is not None and monster_type not in MONSTER_TYPES:
+                    raise ProtocolError(f"unknown monster type {monster_type}")
+            game.reset_battle()
+            game.set_seed()
+            game.set_player_monster(player_type)
+            game.create_enemy_monster(enemy_type)
+            self.in_battle = True
+            return (f"READY {game.get_enemy_type()} {game.get_player_monster().get_current_hp()} "
+                    f"{game.get_enemy_monster().get_current_hp()}")
+
+        if command == "STATS":
+            wins, losses = game.get_stats()
+            return f"STATS {wins} {losses}"
+
+        raise ProtocolError(f"unknown command {command}")
+
+
+class BattleServer:
+    """
+    Server asyncio yang menampung banyak BattleSession
+    Backpressure: setiap balasan menunggu writer.drain() sehingga client yang
+    lambat membaca tidak membuat buffer server membengkak.
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=IDLE_TIMEOUT,
+                 max_sessions=MAX_SESSIONS):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.__sessions = set()
+        self.__server = None
+        self.__evicted = 0
+        self.__total_sessions = 0
+
+    def get_session_count(self):
+        return len(self.__sessions)
+
+    def get_total_sessions(self):
+        return self.__total_sessions
+
+    def get_evicted_count(self):
+        return self.__evicted
+
+    async def start(self):
+        """Mulai listen, mengembalikan port yang dipakai (port=0 memilih port bebas)"""
+        self.__server = await asyncio.start_server(self.__handle_client, self.host, self.port, limit=MAX_LINE)
+        self.port = self.__server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        if self.__server is None:
+            await self.start()
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self):
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+    async def __handle_client(self, reader, writer):
+        if len(self.__sessions) >= self.max_sessions:
+            writer.write(b"ERR busy\n")
+            await self.__close_writer(writer)
+            return
+
+        session = BattleSession()
+        self.__sessions.add(session)
+        self.__total_sessions += 1
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.__evicted += 1
+                    writer.write(b"BYE idle\n")
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not data:
+                    break  # Client menutup koneksi
+
+                try:
+                    line = data.decode("ascii").strip()
+                except UnicodeDecodeError:
+                    line = None
+                if line is not None and line.upper() == "QUIT":
+                    writer.write(b"BYE\n")
+                    break
+                try:
+                    if line is None:
+                        raise ProtocolError("non-ascii command")
+                    reply = session.handle(line)
+                except ProtocolError as error:
+                    reply = f"ERR {error}"
+                writer.write(reply.encode("ascii", "replace") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__sessions.discard(session)
+            await self.__close_writer(writer)
+
+    @staticmethod
+    async def __close_writer(writer):
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# ==================== LOAD GENERATOR ====================
+def percentile(sorted_values, fraction):
+    """Nilai persentil dari list yang sudah diurutkan (nearest rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _run_client(host, port, battles, rng, latencies, player_special_chance):
+    """Satu client: memainkan sejumlah battle lalu QUIT, mengembalikan jumlah turn"""
+    reader, writer = await asyncio.open_connection(host, port)
+    types = list(MONSTER_TYPES)
+    turns = 0
+    try:
+        for _ in range(battles):
+            writer.write(f"START {rng.choice(types)}\n".encode("ascii"))
+            reply = await reader.readline()
+            if not reply.startswith(b"READY"):
+                raise ConnectionError(f"Unexpected reply: {reply!r}")
+            while True:
+                command = b"S\n" if rng.random() < player_special_chance else b"A\n"
+                start = time.perf_counter()
+                writer.write(command)
+                reply = await reader.readline()
+                latencies.append(time.perf_counter() - start)
+                if not reply.startswith(b"TURN"):
+                    raise ConnectionError(f"Unexpected reply: {reply!r}")
+                turns += 1
+                if not reply.rstrip().endswith(b"-"):
+                    break
+        writer.write(b"QUIT\n")
+        await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return turns
+
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, sessions=1000, battles_per_session=3,
+                   concurrency=200, seed=0, player_special_chance=SPECIAL_CHANCE):
+    """
+    Menjalankan sessions client (maksimal concurrency koneksi bersamaan)
+    terhadap server dan mengembalikan LoadReport.
+    """
+    rng = random.Random(seed)
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_session(client_rng):
+        async with semaphore:
+            return await _run_client(host, port, battles_per_session, client_rng,
+                                     latencies, player_special_chance)
+
+    start = time.perf_counter()
+    turns = await asyncio.gather(*(one_session(random.Random(rng.getrandbits(64)))
+                                   for _ in range(sessions)))
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    return LoadReport(
+        sessions, sessions * battles_per_session, sum(turns), seconds,
+        percentile(latencies, 0.50) * 1000, percentile(latencies, 0.99) * 1000,
+        sessions / seconds,
+    )
+
+
+async def run_local_load(sessions=1000, battles_per_session=3, concurrency=200, seed=0):
+    """Menjalankan server di port bebas localhost lalu load generator terhadapnya"""
+    server = BattleServer(port=0)
+    port = await server.start()
+    try:
+        return await run_load(DEFAULT_HOST, port, sessions, battles_per_session, concurrency, seed)
+    finally:
+        await server.close()
+
+
+def format_report(report):
+    return (f"{report.sessions} sessions, {report.battles} battles, {report.turns} turns "
+            f"in {report.seconds:.2f}s\n"
+            f"turn latency p50 {report.p50_ms:.3f} ms | p99 {report.p99_ms:.3f} ms | "
+            f"{report.sessions_per_sec:.0f} sessions/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monster Battle Arena server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="jalankan battle server")
+    serve.add_argument("--host", default=DEFAULT_HOST)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    serve.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+
+    load = subparsers.add_parser("load", help="jalankan load generator")
+    load.add_argument("--host", default=DEFAULT_HOST)
+    load.add_argument("--port", type=int, default=None, help="default: server lokal di port bebas")
+    load.add_argument("--sessions", type=int, default=1000)
+    load.add_argument("--battles", type=int, default=3, help="battle per sesi")
+    load.add_argument("--concurrency", type=int, default=200)
+    load.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = BattleServer(args.host, args.port, args.idle_timeout, args.max_sessions)
+        print(f"Serving on {args.host}:{args.port}")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.port is None:
+        report = asyncio.run(run_local_load(args.sessions, args.battles, args.concurrency, args.seed))
+    else:
+        report = asyncio.run(run_load(args.host, args.port, args.sessions, args.battles,
+                                      args.concurrency, args.seed))
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Monster Battle Arena - Simulator Monte Carlo (NumPy)
+Menjalankan banyak battle sekaligus sebagai array NumPy untuk mengestimasi
+win rate dan rata-rata jumlah turn setiap matchup elemen.
+
+Membutuhkan numpy (pip install numpy).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from monster_engine import MONSTER_TYPES, SPECIAL_CHANCE, build_damage_table
+
+
+# Ukuran batch maksimum per iterasi agar pemakaian memori tetap kecil
+CHUNK_SIZE = 1_000_000
+
+SimulationResult = namedtuple("SimulationResult", ["types", "win_rate", "avg_turns", "battles"])
+
+
+def simulate_matchup(player_type, enemy_type, count, rng,
+                     player_special_chance=SPECIAL_CHANCE, damage_table=None):
+    """
+    Mensimulasikan count battle independen untuk satu matchup.
+    Urutan turn sama seperti run_battle(): pemain menyerang dulu, lalu musuh
+    (special dengan peluang SPECIAL_CHANCE) jika masih hidup.
+    Mengembalikan tuple (jumlah menang, total turn).
+    """
+    if damage_table is None:
+        damage_table = build_damage_table()
+    player_normal, player_special = damage_table[(player_type, enemy_type)]
+    enemy_normal, enemy_special = damage_table[(enemy_type, player_type)]
+    player_max_hp = MONSTER_TYPES[player_type]().get_max_hp()
+    enemy_max_hp = MONSTER_TYPES[enemy_type]().get_max_hp()
+
+    wins = 0
+    total_turns = 0
+    remaining = count
+    while remaining > 0:
+        size = min(remaining, CHUNK_SIZE)
+        remaining -= size
+
+        player_hp = np.full(size, player_max_hp, dtype=np.int32)
+        enemy_hp = np.full(size, enemy_max_hp, dtype=np.int32)
+        turn = 0
+        while player_hp.size:
+            turn += 1
+
+            # Giliran pemain
+            special = rng.random(player_hp.size) < player_special_chance
+            enemy_hp -= np.where(special, player_special, player_normal).astype(np.int32)
+            won = enemy_hp <= 0
+            finished = int(won.sum())
+            wins += finished
+            total_turns += finished * turn
+            player_hp = player_hp[~won]
+            enemy_hp = enemy_hp[~won]
+
+            # Giliran musuh
+            special = rng.random(player_hp.size) < SPECIAL_CHANCE
+            player_hp -= np.where(special, enemy_special, enemy_normal).astype(np.int32)
+            lost = player_hp <= 0
+            total_turns += int(lost.sum()) * turn
+            player_hp = player_hp[~lost]
+            enemy_hp = enemy_hp[~lost]
+
+    return wins, total_turns
+
+
+def simulate_all(count, seed=None, player_special_chance=SPECIAL_CHANCE):
+    """
+    Mensimulasikan count battle untuk setiap pasangan tipe (matriks 3x3).
+    Baris adalah tipe pemain, kolom adalah tipe musuh.
+    """
+    rng = np.random.default_rng(seed)
+    damage_table = build_damage_table()
+    types = list(MONSTER_TYPES)
+    win_rate = np.zeros((len(types), len(types)))
+    avg_turns = np.zeros((len(types), len(types)))
+
+    for i, player_type in enumerate(types):
+        for j, enemy_type in enumerate(types):
+            wins, total_turns = simulate_matchup(
+                player_type, enemy_type, count, rng,
+                player_special_chance=player_special_chance,
+                damage_table=damage_table,
+            )
+            win_rate[i, j] = wins / count
+            avg_turns[i, j] = total_turns / count
+
+    return SimulationResult(types, win_rate, avg_turns, count)
+
+
+def format_matrix(result):
+    """Membuat tabel teks win rate / rata-rata turn untuk ditampilkan"""
+    lines = ["Player \\ Enemy  " + "".join(f"{t:>16}" for t in result.types)]
+    for i, player_type in enumerate(result.types):
+        cells = "".join(
+            f"{result.win_rate[i, j] * 100:8.2f}% /{result.avg_turns[i, j]:5.2f}"
+            for j in range(len(result.types))
+        )
+        lines.append(f"{player_type:<16}{cells}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_matrix(simulate_all(1_000_000, seed=0)))
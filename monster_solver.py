@@ -0,0 +1,143 @@
+"""
+Monster Battle Arena - Solver Peluang Menang (Dynamic Programming)
+Menghitung peluang menang dan ekspektasi jumlah turn secara eksak dengan
+memoization atas state (HP pemain, HP musuh) di awal giliran pemain.
+
+Policy pemain yang didukung:
+- "attack"  : selalu normal attack
+- "special" : selalu special attack
+- "random"  : special dengan peluang SPECIAL_CHANCE (sama seperti musuh)
+- "optimal" : memilih aksi dengan peluang menang terbesar
+
+Musuh memakai special dengan peluang enemy_special_chance (default
+SPECIAL_CHANCE, sama seperti musuh acak di BattleGame).
+"""
+
+from collections import namedtuple
+
+from monster_engine import MONSTER_TYPES, SPECIAL_CHANCE, build_damage_table
+
+
+POLICIES = ("attack", "special", "random", "optimal")
+
+Solution = namedtuple("Solution", ["win_probability", "expected_turns"])
+
+# Cache bersama: (player_type, enemy_type, policy, enemy_special_chance) -> {(player_hp, enemy_hp): Solution}
+_TABLES = {}
+_DAMAGE_TABLE = None
+
+
+def _damage_table():
+    """Damage table di-cache sekali untuk semua pemanggilan"""
+    global _DAMAGE_TABLE
+    if _DAMAGE_TABLE is None:
+        _DAMAGE_TABLE = build_damage_table()
+    return _DAMAGE_TABLE
+
+
+def clear_cache():
+    """Menghapus semua tabel hasil solver"""
+    global _DAMAGE_TABLE
+    _TABLES.clear()
+    _DAMAGE_TABLE = None
+
+
+def _table(player_type, enemy_type, policy, enemy_special_chance):
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    key = (player_type, enemy_type, policy, enemy_special_chance)
+    if key not in _TABLES:
+        _TABLES[key] = {}
+    return _TABLES[key]
+
+
+def _after_action(player_type, enemy_type, policy, player_hp, enemy_hp, damage, enemy_special_chance):
+    """
+    Nilai satu aksi pemain dengan damage tertentu, termasuk balasan musuh.
+    Mengembalikan Solution yang menghitung turn saat ini.
+    """
+    enemy_hp -= damage
+    if enemy_hp <= 0:
+        return Solution(1.0, 1.0)
+
+    enemy_normal, enemy_special = _damage_table()[(enemy_type, player_type)]
+    win = 0.0
+    turns = 1.0
+    for probability, enemy_damage in ((1 - enemy_special_chance, enemy_normal),
+                                      (enemy_special_chance, enemy_special)):
+        remaining_hp = player_hp - enemy_damage
+        if remaining_hp > 0 and probability:
+            next_state = _solve_state(player_type, enemy_type, policy, remaining_hp, enemy_hp,
+                                      enemy_special_chance)
+            win += probability * next_state.win_probability
+            turns += probability * next_state.expected_turns
+    return Solution(win, turns)
+
+
+def _solve_state(player_type, enemy_type, policy, player_hp, enemy_hp, enemy_special_chance=SPECIAL_CHANCE):
+    table = _table(player_type, enemy_type, policy, enemy_special_chance)
+    state = (player_hp, enemy_hp)
+    if state in table:
+        return table[state]
+
+    values = action_values(player_type, enemy_type, player_hp, enemy_hp, policy, enemy_special_chance)
+    if policy == "random":
+        normal, special = values
+        solution = Solution(
+            (1 - SPECIAL_CHANCE) * normal.win_probability + SPECIAL_CHANCE * special.win_probability,
+            (1 - SPECIAL_CHANCE) * normal.expected_turns + SPECIAL_CHANCE * special.expected_turns,
+        )
+    elif policy == "attack":
+        solution = values[0]
+    elif policy == "special":
+        solution = values[1]
+    else:
+        # Optimal: peluang menang terbesar, jika seri pilih yang lebih cepat
+        solution = max(values, key=lambda s: (s.win_probability, -s.expected_turns))
+
+    table[state] = solution
+    return solution
+
+
+def action_values(player_type, enemy_type, player_hp, enemy_hp, policy="optimal",
+                  enemy_special_chance=SPECIAL_CHANCE):
+    """
+    Peluang menang untuk (normal attack, special attack) pada state tertentu,
+    dengan asumsi pemain mengikuti policy di giliran-giliran berikutnya dan
+    musuh memakai special dengan peluang enemy_special_chance.
+    """
+    normal, special = _damage_table()[(player_type, enemy_type)]
+    return (
+        _after_action(player_type, enemy_type, policy, player_hp, enemy_hp, normal, enemy_special_chance),
+        _after_action(player_type, enemy_type, policy, player_hp, enemy_hp, special, enemy_special_chance),
+    )
+
+
+def win_probability(player_type, enemy_type, player_hp=None, enemy_hp=None, policy="random",
+                    enemy_special_chance=SPECIAL_CHANCE):
+    """
+    Peluang menang dan ekspektasi turn dari state tertentu (default: HP penuh)
+    di awal giliran pemain.
+    """
+    if player_hp is None:
+        player_hp = MONSTER_TYPES[player_type]().get_max_hp()
+    if enemy_hp is None:
+        enemy_hp = MONSTER_TYPES[enemy_type]().get_max_hp()
+    return _solve_state(player_type, enemy_type, policy, player_hp, enemy_hp, enemy_special_chance)
+
+
+def solve_all(policy="random"):
+    """Solution untuk setiap matchup: {(player_type, enemy_type): Solution}"""
+    return {
+        (player_type, enemy_type): win_probability(player_type, enemy_type, policy=policy)
+        for player_type in MONSTER_TYPES
+        for enemy_type in MONSTER_TYPES
+    }
+
+
+if __name__ == "__main__":
+    for policy in POLICIES:
+        print(f"Policy: {policy}")
+        for (player_type, enemy_type), solution in solve_all(policy).items():
+            print(f"  {player_type:>5} vs {enemy_type:<5}  "
+                  f"win {solution.win_probability * 100:6.2f}%  turns {solution.expected_turns:.3f}")
@@ -0,0 +1,189 @@
+"""
+Monster Battle Arena - Stats Store (SQLite)
+Menyimpan setiap battle yang selesai ke database SQLite lokal (mode WAL).
+Insert dikumpulkan dan ditulis per batch dalam satu transaksi, sekaligus
+meng-update tabel ringkasan per species dan per matchup sehingga statistik
+bisa dibaca tanpa memindai seluruh history.
+
+Pemakaian:
+    store = StatsStore("monster_stats.db")
+    game.set_stats_store(store)   # check_battle_end() mencatat hasil battle
+    store.get_totals()            # (wins, losses) seluruh history
+    store.close()
+"""
+
+import sqlite3
+import time
+from collections import namedtuple
+
+
+DEFAULT_PATH = "monster_stats.db"
+BATCH_SIZE = 100  # Battle per transaksi
+FLUSH_INTERVAL = 1.0  # Detik maksimum sebuah battle menunggu di batch
+
+SpeciesStats = namedtuple("SpeciesStats", ["monster_type", "battles", "wins", "losses"])
+MatchupStats = namedtuple("MatchupStats", [
+    "player_type", "enemy_type", "battles", "wins", "losses", "avg_turns",
+])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    player_type TEXT NOT NULL,
+    enemy_type TEXT NOT NULL,
+    result TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    player_hp INTEGER NOT NULL,
+    enemy_hp INTEGER NOT NULL,
+    seed TEXT
+);
+CREATE TABLE IF NOT EXISTS species_stats (
+    monster_type TEXT PRIMARY KEY,
+    battles INTEGER NOT NULL,
+    wins INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matchup_stats (
+    player_type TEXT NOT NULL,
+    enemy_type TEXT NOT NULL,
+    battles INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    total_turns INTEGER NOT NULL,
+    PRIMARY KEY (player_type, enemy_type)
+);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, wins, losses) VALUES (1, 0, 0);
+"""
+
+
+class StatsStore:
+    """
+    History dan statistik battle di SQLite
+    Battle baru ditahan di memori sampai batch penuh atau FLUSH_INTERVAL lewat,
+    lalu ditulis bersama update tabel ringkasan dalam satu transaksi.
+    """
+    def __init__(self, path=DEFAULT_PATH, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.__connection = sqlite3.connect(path)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")  # Aman untuk WAL, fsync per checkpoint
+        self.__connection.executescript(_SCHEMA)
+        self.__pending = []
+        self.__last_flush = time.monotonic()
+        # Total di-cache di memori agar get_totals() tidak perlu query
+        self.__wins, self.__losses = self.__connection.execute(
+            "SELECT wins, losses FROM totals WHERE id = 1"
+        ).fetchone()
+
+    def record(self, player_type, enemy_type, result, turns, player_hp, enemy_hp, seed=None):
+        """Mencatat satu battle yang selesai (result "win" atau "lose")"""
+        if result == "win":
+            self.__wins += 1
+        else:
+            self.__losses += 1
+        self.__pending.append((time.time(), player_type, enemy_type, result, turns,
+                               player_hp, enemy_hp, None if seed is None else str(seed)))
+        if (len(self.__pending) >= self.batch_size
+                or time.monotonic() - self.__last_flush >= self.flush_interval):
+            self.flush()
+
+    def record_game(self, game, result):
+        """Mencatat battle dari BattleGame (dipanggil oleh check_battle_end)"""
+        self.record(game.get_player_type(), game.get_enemy_type(), result, game.get_turn(),
+                    game.get_player_monster().get_current_hp(),
+                    game.get_enemy_monster().get_current_hp(), game.get_seed())
+
+    def flush(self):
+        """Menulis semua battle yang tertunda dalam satu transaksi"""
+        self.__last_flush = time.monotonic()
+        if not self.__pending:
+            return
+        pending, self.__pending = self.__pending, []
+
+        species = {}  # monster_type -> [battles, wins]
+        matchups = {}  # (player_type, enemy_type) -> [battles, wins, total_turns]
+        wins = 0
+        for _, player_type, enemy_type, result, turns, _, _, _ in pending:
+            won = result == "win"
+            wins += won
+            for monster_type, monster_won in ((player_type, won), (enemy_type, not won)):
+                row = species.setdefault(monster_type, [0, 0])
+                row[0] += 1
+                row[1] += monster_won
+            row = matchups.setdefault((player_type, enemy_type), [0, 0, 0])
+            row[0] += 1
+            row[1] += won
+            row[2] += turns
+
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO battles (played_at, player_type, enemy_type, result, turns,"
+                " player_hp, enemy_hp, seed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                pending,
+            )
+            self.__connection.executemany(
+                "INSERT INTO species_stats (monster_type, battles, wins) VALUES (?, ?, ?)"
+                " ON CONFLICT (monster_type) DO UPDATE SET"
+                " battles = battles + excluded.battles, wins = wins + excluded.wins",
+                [(monster_type, b, w) for monster_type, (b, w) in species.items()],
+            )
+            self.__connection.executemany(
+                "INSERT INTO matchup_stats (player_type, enemy_type, battles, wins, total_turns)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (player_type, enemy_type) DO UPDATE SET"
+                " battles = battles + excluded.battles, wins = wins + excluded.wins,"
+                " total_turns = total_turns + excluded.total_turns",
+                [(p, e, b, w, t) for (p, e), (b, w, t) in matchups.items()],
+            )
+            self.__connection.execute(
+                "UPDATE totals SET wins = wins + ?, losses = losses + ? WHERE id = 1",
+                (wins, len(pending) - wins),
+            )
+
+    def get_totals(self):
+        """(wins, losses) pemain di seluruh history, tanpa query database"""
+        return self.__wins, self.__losses
+
+    def get_battle_count(self):
+        return self.__wins + self.__losses
+
+    def species_stats(self):
+        """Statistik per species (sebagai pemain maupun musuh)"""
+        self.flush()
+        rows = self.__connection.execute(
+            "SELECT monster_type, battles, wins FROM species_stats ORDER BY monster_type"
+        )
+        return [SpeciesStats(t, b, w, b - w) for t, b, w in rows]
+
+    def matchup_stats(self):
+        """Statistik pemain per matchup (player_type, enemy_type)"""
+        self.flush()
+        rows = self.__connection.execute(
+            "SELECT player_type, enemy_type, battles, wins, total_turns FROM matchup_stats"
+            " ORDER BY player_type, enemy_type"
+        )
+        return [MatchupStats(p, e, b, w, b - w, t / b) for p, e, b, w, t in rows]
+
+    def recent_battles(self, count=10):
+        """count battle terakhir yang sudah ditulis, terbaru di depan"""
+        self.flush()
+        return self.__connection.execute(
+            "SELECT played_at, player_type, enemy_type, result, turns FROM battles"
+            " ORDER BY id DESC LIMIT ?", (count,)
+        ).fetchall()
+
+    def close(self):
+        """Menulis battle yang tertunda lalu menutup database"""
+        self.flush()
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
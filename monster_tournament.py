@@ -0,0 +1,169 @@
+"""
+Monster Battle Arena - Tournament Runner (multi-proses)
+Menjalankan round-robin tournament antar monster dengan membagi setiap
+matchup menjadi beberapa shard yang dikerjakan oleh ProcessPoolExecutor.
+
+Setiap shard memakai RNG sendiri dengan seed yang diturunkan dari
+(seed, matchup, nomor shard), sehingga hasilnya deterministik dan tidak
+tergantung jumlah worker maupun urutan selesainya shard.
+"""
+
+import os
+import time
+from collections import namedtuple
+
+from monster_engine import MONSTER_TYPES, SPECIAL_CHANCE, run_battles
+
+
+# Peserta default: nama monster -> tipe
+DEFAULT_PARTICIPANTS = {
+    "Flameo": "Fire",
+    "Aqualis": "Water",
+    "Terrados": "Earth",
+}
+
+# Jumlah battle per shard (satu unit kerja untuk worker)
+SHARD_SIZE = 5000
+
+ShardResult = namedtuple("ShardResult", ["player", "enemy", "battles", "wins", "total_turns"])
+Standing = namedtuple("Standing", ["name", "monster_type", "battles", "wins", "losses", "win_rate"])
+
+
+def shard_seed(seed, player, enemy, index):
+    """Seed deterministik untuk satu shard"""
+    return f"{seed}:{player}:{enemy}:{index}"
+
+
+def _run_shard(player, player_type, enemy, enemy_type, battles, seed, player_special_chance):
+    """Dijalankan di worker: memainkan satu shard battle"""
+    results = run_battles(player_type, enemy_type, battles, seed=seed,
+                          player_special_chance=player_special_chance)
+    wins = 0
+    total_turns = 0
+    for result in results:
+        if result.result == "win":
+            wins += 1
+        total_turns += result.turns
+    return ShardResult(player, enemy, battles, wins, total_turns)
+
+
+def make_shards(participants, battles_per_matchup, seed=0, shard_size=SHARD_SIZE):
+    """
+    Membagi semua matchup round-robin (setiap peserta sebagai pemain melawan
+    setiap peserta lain sebagai musuh) menjadi daftar argumen shard.
+    """
+    for name, monster_type in participants.items():
+        if monster_type not in MONSTER_TYPES:
+            raise ValueError(f"Unknown monster type for {name}: {monster_type}")
+
+    shards = []
+    for player, player_type in participants.items():
+        for enemy, enemy_type in participants.items():
+            if player == enemy:
+                continue
+            remaining = battles_per_matchup
+            index = 0
+            while remaining > 0:
+                size = min(remaining, shard_size)
+                shards.append((player, player_type, enemy, enemy_type, size,
+                               shard_seed(seed, player, enemy, index)))
+                remaining -= size
+                index += 1
+    return shards
+
+
+def iter_tournament(participants=None, battles_per_matchup=10000, seed=0, workers=None,
+                    shard_size=SHARD_SIZE, player_special_chance=SPECIAL_CHANCE):
+    """
+    Generator yang menjalankan tournament dan mengirimkan ShardResult
+    segera setelah setiap shard selesai (partial results).
+    workers=1 menjalankan semuanya di proses ini tanpa pool.
+    """
+    if participants is None:
+        participants = DEFAULT_PARTICIPANTS
+    shards = make_shards(participants, battles_per_matchup, seed, shard_size)
+
+    if workers == 1:
+        for shard in shards:
+            yield _run_shard(*shard, player_special_chance)
+        return
+
+    # Di-import di sini: concurrent.futures memperlambat start perintah serial/headless
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_shard, *shard, player_special_chance) for shard in shards]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def standings(participants, shard_results):
+    """Menggabungkan ShardResult menjadi klasemen, diurutkan dari win rate tertinggi"""
+    totals = {name: [0, 0] for name in participants}  # name -> [battles, wins]
+    for shard in shard_results:
+        losses = shard.battles - shard.wins
+        totals[shard.player][0] += shard.battles
+        totals[shard.player][1] += shard.wins
+        totals[shard.enemy][0] += shard.battles
+        totals[shard.enemy][1] += losses
+
+    table = []
+    for name, (battles, wins) in totals.items():
+        win_rate = wins / battles if battles else 0.0
+        table.append(Standing(name, participants[name], battles, wins, battles - wins, win_rate))
+    table.sort(key=lambda s: s.win_rate, reverse=True)
+    return table
+
+
+def run_tournament(participants=None, battles_per_matchup=10000, seed=0, workers=None,
+                   shard_size=SHARD_SIZE, player_special_chance=SPECIAL_CHANCE, on_progress=None):
+    """
+    Menjalankan tournament sampai selesai dan mengembalikan klasemen.
+    on_progress(done, total, shard_result) dipanggil setiap shard selesai.
+    """
+    if participants is None:
+        participants = DEFAULT_PARTICIPANTS
+    total = len(make_shards(participants, battles_per_matchup, seed, shard_size))
+    results = []
+    for shard in iter_tournament(participants, battles_per_matchup, seed, workers,
+                                 shard_size, player_special_chance):
+        results.append(shard)
+        if on_progress is not None:
+            on_progress(len(results), total, shard)
+    return standings(participants, results)
+
+
+def measure_speedup(battles_per_matchup=20000, seed=0, workers=None):
+    """
+    Membandingkan waktu tournament dengan 1 proses vs process pool.
+    Mengembalikan tuple (waktu_serial, waktu_paralel, speedup, jumlah_worker).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    serial = run_tournament(battles_per_matchup=battles_per_matchup, seed=seed, workers=1)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = run_tournament(battles_per_matchup=battles_per_matchup, seed=seed, workers=workers)
+    parallel_time = time.perf_counter() - start
+
+    if serial != parallel:
+        raise RuntimeError("Parallel tournament result differs from serial run")
+    return serial_time, parallel_time, serial_time / parallel_time, workers
+
+
+def format_standings(table):
+    """Membuat tabel klasemen dalam bentuk teks"""
+    lines = [f"{'Monster':<12}{'Type':<8}{'Battles':>10}{'Wins':>10}{'Losses':>10}{'Win %':>9}"]
+    for s in table:
+        lines.append(f"{s.name:<12}{s.monster_type:<8}{s.battles:>10}{s.wins:>10}"
+                     f"{s.losses:>10}{s.win_rate * 100:>8.2f}%")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    serial_time, parallel_time, speedup, workers = measure_speedup()
+    print(format_standings(run_tournament(workers=workers)))
+    print(f"\nSerial: {serial_time:.2f}s | {workers} workers: {parallel_time:.2f}s | speedup {speedup:.2f}x")
@@ -0,0 +1,96 @@
+"""
+Test tingkat kesulitan EnemyAI (monster_ai)
+Jalankan: python -m pytest -q  (atau python -m unittest test_monster_ai)
+"""
+
+import unittest
+
+from monster_ai import DIFFICULTIES, EnemyAI, enemy_special_chance
+from monster_engine import BattleGame, build_damage_table, play_battle
+
+
+BATTLES = 2000
+
+
+def enemy_win_rate(difficulty, player_type, enemy_type, battles=BATTLES, seed=1):
+    """Persentase battle yang dimenangkan musuh pada tingkat kesulitan tertentu"""
+    game = BattleGame(seed=seed)
+    if DIFFICULTIES[difficulty] is not None:
+        game.set_enemy_ai(EnemyAI(difficulty))
+    losses = 0
+    for _ in range(battles):
+        game.reset_battle()
+        game.set_player_monster(player_type)
+        game.create_enemy_monster(enemy_type)
+        losses += play_battle(game).result == "lose"
+    return losses / battles
+
+
+class DifficultyTest(unittest.TestCase):
+    def test_difficulties_are_distinct_and_ordered(self):
+        for player_type, enemy_type in (("Water", "Fire"), ("Fire", "Earth"), ("Earth", "Earth")):
+            rates = [enemy_win_rate(d, player_type, enemy_type) for d in DIFFICULTIES]
+            with self.subTest(matchup=(player_type, enemy_type), rates=rates):
+                for easier, harder in zip(rates, rates[1:]):
+                    self.assertGreater(harder - easier, 0.04)
+
+    def test_search_picks_special_with_engine_damage(self):
+        game = BattleGame(seed=3)
+        game.set_enemy_ai(EnemyAI("expert"))
+        game.set_player_monster("Fire")
+        game.create_enemy_monster("Water")
+        game.player_attack()
+        self.assertTrue(game.enemy_attack()[3])
+
+    def test_search_picks_normal_when_it_is_stronger(self):
+        # Damage table tiruan: serangan normal musuh (Fire) lebih kuat dari special-nya
+        table = build_damage_table()
+        table[("Fire", "Water")] = (40, 10)
+        ai = EnemyAI("expert", time_budget=1.0, damage_table=table)
+        game = BattleGame(seed=3)
+        game.set_enemy_ai(ai)
+        game.set_player_monster("Water")
+        game.create_enemy_monster("Fire")
+        while game.check_battle_end() is None:
+            game.player_attack()
+            if game.check_battle_end() is not None:
+                break
+            self.assertFalse(game.enemy_attack()[3])
+            self.assertGreaterEqual(ai.get_last_depth(), 1)  # Pilihan berasal dari search
+        self.assertGreater(ai.get_table_size(), 0)
+
+    def test_search_without_time_falls_back(self):
+        ai = EnemyAI("expert", time_budget=0.0)
+        game = BattleGame(seed=3)
+        game.set_enemy_ai(ai)
+        game.set_player_monster("Water")
+        game.create_enemy_monster("Fire")
+        self.assertTrue(ai.choose(game))
+        self.assertEqual(ai.get_last_depth(), 0)
+
+    def test_enemy_special_chance_matches_battles(self):
+        # Peluang yang dipakai overlay win odds (monster_solver) harus sesuai perilaku AI
+        for difficulty in DIFFICULTIES:
+            game = BattleGame(seed=5)
+            if DIFFICULTIES[difficulty] is not None:
+                game.set_enemy_ai(EnemyAI(difficulty))
+            specials = turns = 0
+            for _ in range(500):
+                game.reset_battle()
+                game.set_player_monster("Earth")
+                game.create_enemy_monster("Earth")
+                play_battle(game)
+                for event in game.get_battle_log():
+                    if event.actor == "enemy":
+                        turns += 1
+                        specials += event.is_special
+            with self.subTest(difficulty=difficulty):
+                self.assertAlmostEqual(specials / turns, enemy_special_chance(difficulty), delta=0.03)
+
+    def test_unknown_difficulty(self):
+        with self.assertRaises(ValueError):
+            EnemyAI("impossible")
+
+
+if __name__ == "__main__":
+    unittest.main()
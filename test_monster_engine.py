@@ -0,0 +1,83 @@
+"""
+Test Monster dan snapshot/restore BattleGame (monster_engine)
+Jalankan: python -m pytest -q  (atau python -m unittest test_monster_engine)
+"""
+
+import random
+import unittest
+
+from monster_engine import BattleGame, FireMonster, Monster, play_battle
+
+
+def new_game(seed=7):
+    game = BattleGame(seed=seed)
+    game.set_player_monster("Water")
+    game.create_enemy_monster("Fire")
+    return game
+
+
+class MonsterTest(unittest.TestCase):
+    def test_stats_constructor(self):
+        monster = Monster("Custom", 100, 20, "Fire", "#fff")
+        self.assertEqual(monster.get_name(), "Custom")
+        self.assertEqual(monster.get_current_hp(), 100)
+        self.assertEqual(monster.get_attack_power(), 20)
+        self.assertIs(monster.get_species(), Monster("Custom", 100, 20, "Fire", "#fff").get_species())
+
+    def test_species_constructor(self):
+        monster = Monster("Copy", species=FireMonster.SPECIES)
+        self.assertEqual(monster.get_name(), "Copy")
+        self.assertIs(monster.get_species(), FireMonster().get_species())
+
+    def test_missing_stats(self):
+        with self.assertRaises(TypeError):
+            Monster("x")
+        with self.assertRaises(TypeError):
+            Monster("x", 100)
+
+
+class SnapshotRngTest(unittest.TestCase):
+    def test_snapshot_sees_draws_through_get_rng(self):
+        game = new_game()
+        game.snapshot()
+        rng = game.get_rng()
+        before = game.snapshot()
+        expected = [rng.random() for _ in range(3)]
+        after = game.snapshot()
+        self.assertIsNot(after[3], before[3])
+        self.assertEqual(after[3], rng.getstate())
+
+        game.restore(before)
+        self.assertEqual([rng.random() for _ in range(3)], expected)
+        game.restore(after)
+        self.assertEqual(rng.getstate(), after[3])
+
+    def test_snapshot_sees_game_draws(self):
+        game = new_game()
+        before = game.snapshot()
+        values = [game.random() for _ in range(3)]
+        self.assertNotEqual(game.snapshot()[3], before[3])
+        game.restore(before)
+        self.assertEqual([game.random() for _ in range(3)], values)
+
+    def test_shared_module_rng_is_not_cached(self):
+        game = BattleGame()
+        game.set_player_monster("Fire")
+        game.create_enemy_monster("Earth")
+        before = game.snapshot()
+        random.random()
+        self.assertNotEqual(game.snapshot()[3], before[3])
+
+    def test_restore_replays_battle(self):
+        game = new_game()
+        start = game.snapshot()
+        first = play_battle(game)
+        game.reset_battle()
+        game.set_player_monster("Water")
+        game.create_enemy_monster("Fire")
+        game.restore(start)
+        self.assertEqual(play_battle(game), first)
+
+
+if __name__ == "__main__":
+    unittest.main()